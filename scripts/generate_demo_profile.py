@@ -21,7 +21,6 @@ Key compliance gaps:
   - Other medium-severity gaps
 """
 
-import json
 import os
 import sys
 
@@ -180,7 +179,7 @@ def main() -> None:
     fixture_path = os.path.join(fixture_dir, "talentscreen_profile.json")
 
     with open(fixture_path, "w", encoding="utf-8") as fh:
-        json.dump(profile.model_dump(mode="json"), fh, indent=2, ensure_ascii=False, default=str)
+        fh.write(profile.model_dump_json(indent=2))
 
     print(f"TalentScreen AI profile saved to: {fixture_path}")
     print(f"  System:      {profile.system_name}")
@@ -9,15 +9,18 @@ This script:
 5. Exports JSON and HTML reports
 """
 
+import io
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Ensure the src directory is on the path when running as a script
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.join(_PROJECT_ROOT, "src"))
 
 from regulationcoder.core.engine import ComplianceEngine
+from regulationcoder.models.evaluation import RuleVerdict
 from regulationcoder.models.profile import SystemProfile
 
 
@@ -33,26 +36,40 @@ _DIM = "\033[2m"
 _RESET = "\033[0m"
 
 
-def _severity_colour(severity: str) -> str:
-    return {
-        "critical": _RED + _BOLD,
-        "high": _RED,
-        "medium": _YELLOW,
-        "low": _DIM,
-        "info": _DIM,
-    }.get(severity, "")
+_SEVERITY_COLOURS = {
+    "critical": _RED + _BOLD,
+    "high": _RED,
+    "medium": _YELLOW,
+    "low": _DIM,
+    "info": _DIM,
+}
 
+_VERDICT_COLOURS = {
+    "pass": _GREEN,
+    "fail": _RED,
+    "not_applicable": _DIM,
+    "manual_review": _YELLOW,
+}
 
-def _verdict_colour(verdict: str) -> str:
-    return {
-        "pass": _GREEN,
-        "fail": _RED,
-        "not_applicable": _DIM,
-        "manual_review": _YELLOW,
-    }.get(verdict, "")
+
+# Pre-rendered (colour, right-aligned label) columns for the rule-by-rule table
+_VERDICT_TAGS = {
+    v: (_VERDICT_COLOURS.get(v.value, ""), v.value.upper().replace("_", " ").rjust(14))
+    for v in RuleVerdict
+}
+_SEVERITY_TAGS = {
+    severity: (colour, severity.rjust(8)) for severity, colour in _SEVERITY_COLOURS.items()
+}
 
 
 def main() -> None:
+    # Buffer the whole report and write it to stdout once at the end
+    out = io.StringIO()
+
+    def emit(line: str = "") -> None:
+        out.write(line)
+        out.write("\n")
+
     # ----- Step 1: Load profile -----
     fixture_path = os.path.join(
         _PROJECT_ROOT, "tests", "fixtures", "talentscreen_profile.json"
@@ -67,87 +84,84 @@ def main() -> None:
         profile_data = json.load(fh)
 
     profile = SystemProfile(**profile_data)
-    print(f"\n{_BOLD}{'=' * 72}{_RESET}")
-    print(f"{_BOLD}  RegulationCoder  --  Demo Pipeline{_RESET}")
-    print(f"{_BOLD}{'=' * 72}{_RESET}")
-    print(f"\n  System:     {_CYAN}{profile.system_name}{_RESET}")
-    print(f"  Provider:   {profile.provider_name} ({profile.provider_jurisdiction})")
-    print(f"  Version:    {profile.system_version}")
-    print(f"  High-risk:  {profile.is_high_risk}")
-    print(f"  Category:   {profile.high_risk_category}")
-    print(f"  Annex III:  {profile.annex_iii_section}")
+    emit(f"\n{_BOLD}{'=' * 72}{_RESET}")
+    emit(f"{_BOLD}  RegulationCoder  --  Demo Pipeline{_RESET}")
+    emit(f"{_BOLD}{'=' * 72}{_RESET}")
+    emit(f"\n  System:     {_CYAN}{profile.system_name}{_RESET}")
+    emit(f"  Provider:   {profile.provider_name} ({profile.provider_jurisdiction})")
+    emit(f"  Version:    {profile.system_version}")
+    emit(f"  High-risk:  {profile.is_high_risk}")
+    emit(f"  Category:   {profile.high_risk_category}")
+    emit(f"  Annex III:  {profile.annex_iii_section}")
 
     # ----- Step 2: Create engine -----
-    print(f"\n{_DIM}Loading EU AI Act regulation data ...{_RESET}")
+    emit(f"\n{_DIM}Loading EU AI Act regulation data ...{_RESET}")
     engine = ComplianceEngine(regulation="eu-ai-act-v1")
 
     # ----- Step 3: Evaluate -----
-    print(f"{_DIM}Evaluating {profile.system_name} against {engine.regulation} ...{_RESET}\n")
+    emit(f"{_DIM}Evaluating {profile.system_name} against {engine.regulation} ...{_RESET}\n")
     report = engine.evaluate(profile)
 
     # ----- Step 4: Print summary -----
     s = report.summary
     score_colour = _GREEN if s.compliance_score >= 90 else (_YELLOW if s.compliance_score >= 60 else _RED)
 
-    print(f"{_BOLD}{'=' * 72}{_RESET}")
-    print(f"{_BOLD}  EVALUATION RESULTS{_RESET}")
-    print(f"{_BOLD}{'=' * 72}{_RESET}")
-    print(
+    emit(f"{_BOLD}{'=' * 72}{_RESET}")
+    emit(f"{_BOLD}  EVALUATION RESULTS{_RESET}")
+    emit(f"{_BOLD}{'=' * 72}{_RESET}")
+    emit(
         f"\n  Compliance Score:   {score_colour}{_BOLD}{s.compliance_score} / 100{_RESET}"
     )
     verdict_label = report.overall_verdict.replace("_", " ").title()
-    print(
+    emit(
         f"  Overall Verdict:    {score_colour}{_BOLD}{verdict_label}{_RESET}"
     )
-    print()
-    print(f"  Total Rules:        {s.total_rules}")
-    print(f"  {_GREEN}Passed:{_RESET}             {s.passed}")
-    print(f"  {_RED}Failed:{_RESET}             {s.failed}")
-    print(f"  {_DIM}Not Applicable:{_RESET}     {s.not_applicable}")
-    print(f"  {_YELLOW}Manual Review:{_RESET}      {s.manual_review}")
+    emit()
+    emit(f"  Total Rules:        {s.total_rules}")
+    emit(f"  {_GREEN}Passed:{_RESET}             {s.passed}")
+    emit(f"  {_RED}Failed:{_RESET}             {s.failed}")
+    emit(f"  {_DIM}Not Applicable:{_RESET}     {s.not_applicable}")
+    emit(f"  {_YELLOW}Manual Review:{_RESET}      {s.manual_review}")
 
     # Gaps summary
     total_gaps = len(report.critical_gaps) + len(report.high_gaps) + len(report.medium_gaps)
     if total_gaps > 0:
-        print(f"\n{_BOLD}{'=' * 72}{_RESET}")
-        print(f"{_BOLD}  COMPLIANCE GAPS ({total_gaps} total){_RESET}")
-        print(f"{_BOLD}{'=' * 72}{_RESET}\n")
+        emit(f"\n{_BOLD}{'=' * 72}{_RESET}")
+        emit(f"{_BOLD}  COMPLIANCE GAPS ({total_gaps} total){_RESET}")
+        emit(f"{_BOLD}{'=' * 72}{_RESET}\n")
 
         if report.critical_gaps:
-            print(f"  {_RED}{_BOLD}CRITICAL ({len(report.critical_gaps)}){_RESET}")
+            emit(f"  {_RED}{_BOLD}CRITICAL ({len(report.critical_gaps)}){_RESET}")
             for g in report.critical_gaps:
-                print(f"    {_RED}* {g.description}{_RESET}")
-                print(f"      Rule: {g.rule_id}  |  {g.article_ref}")
-                print(f"      Remediation: {g.remediation}\n")
+                emit(f"    {_RED}* {g.description}{_RESET}")
+                emit(f"      Rule: {g.rule_id}  |  {g.article_ref}")
+                emit(f"      Remediation: {g.remediation}\n")
 
         if report.high_gaps:
-            print(f"  {_RED}HIGH ({len(report.high_gaps)}){_RESET}")
+            emit(f"  {_RED}HIGH ({len(report.high_gaps)}){_RESET}")
             for g in report.high_gaps:
-                print(f"    {_RED}* {g.description}{_RESET}")
-                print(f"      Rule: {g.rule_id}  |  {g.article_ref}")
-                print(f"      Remediation: {g.remediation}\n")
+                emit(f"    {_RED}* {g.description}{_RESET}")
+                emit(f"      Rule: {g.rule_id}  |  {g.article_ref}")
+                emit(f"      Remediation: {g.remediation}\n")
 
         if report.medium_gaps:
-            print(f"  {_YELLOW}MEDIUM ({len(report.medium_gaps)}){_RESET}")
+            emit(f"  {_YELLOW}MEDIUM ({len(report.medium_gaps)}){_RESET}")
             for g in report.medium_gaps:
-                print(f"    {_YELLOW}* {g.description}{_RESET}")
-                print(f"      Rule: {g.rule_id}  |  {g.article_ref}")
-                print(f"      Remediation: {g.remediation}\n")
+                emit(f"    {_YELLOW}* {g.description}{_RESET}")
+                emit(f"      Rule: {g.rule_id}  |  {g.article_ref}")
+                emit(f"      Remediation: {g.remediation}\n")
 
     # Per-rule details
-    print(f"\n{_BOLD}{'=' * 72}{_RESET}")
-    print(f"{_BOLD}  RULE-BY-RULE RESULTS{_RESET}")
-    print(f"{_BOLD}{'=' * 72}{_RESET}\n")
+    emit(f"\n{_BOLD}{'=' * 72}{_RESET}")
+    emit(f"{_BOLD}  RULE-BY-RULE RESULTS{_RESET}")
+    emit(f"{_BOLD}{'=' * 72}{_RESET}\n")
 
+    rows = []
     for r in report.rule_results:
-        v_col = _verdict_colour(r.verdict.value)
-        s_col = _severity_colour(r.severity)
-        verdict_tag = r.verdict.value.upper().replace("_", " ")
-        print(
-            f"  [{v_col}{verdict_tag:>14}{_RESET}]  "
-            f"[{s_col}{r.severity:>8}{_RESET}]  "
-            f"{r.rule_id}  {r.title}"
-        )
+        v_col, v_tag = _VERDICT_TAGS[r.verdict]
+        s_col, s_tag = _SEVERITY_TAGS.get(r.severity) or ("", f"{r.severity:>8}")
+        rows.append(f"  [{v_col}{v_tag}{_RESET}]  [{s_col}{s_tag}{_RESET}]  {r.rule_id}  {r.title}")
+    emit("\n".join(rows))
 
     # ----- Step 5: Export reports -----
     output_dir = os.path.join(_PROJECT_ROOT, "output")
@@ -156,20 +170,26 @@ def main() -> None:
     json_path = os.path.join(output_dir, "talentscreen_report.json")
     html_path = os.path.join(output_dir, "talentscreen_report.html")
 
-    report.export_json(json_path)
-    report.export_html(html_path)
-
-    print(f"\n{_BOLD}{'=' * 72}{_RESET}")
-    print(f"{_BOLD}  EXPORTS{_RESET}")
-    print(f"{_BOLD}{'=' * 72}{_RESET}")
-    print(f"\n  JSON report:  {json_path}")
-    print(f"  HTML report:  {html_path}")
-    print()
-    print(
+    # Independent I/O-bound exports; run them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        json_future = pool.submit(report.export_json, json_path)
+        html_future = pool.submit(report.export_html, html_path)
+        json_future.result()
+        html_future.result()
+
+    emit(f"\n{_BOLD}{'=' * 72}{_RESET}")
+    emit(f"{_BOLD}  EXPORTS{_RESET}")
+    emit(f"{_BOLD}{'=' * 72}{_RESET}")
+    emit(f"\n  JSON report:  {json_path}")
+    emit(f"  HTML report:  {html_path}")
+    emit()
+    emit(
         f"{_DIM}DISCLAIMER: This report is an engineering interpretation of regulatory "
         f"requirements. It does not constitute legal advice.{_RESET}\n"
     )
 
+    sys.stdout.write(out.getvalue())
+
 
 if __name__ == "__main__":
     main()
@@ -3,13 +3,29 @@
 import asyncio
 import json
 import logging
+import time
+import uuid
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 from regulationcoder.api.routers import audit, evaluate, regulations, requirements, rules, upload
+from regulationcoder.api.store import Store, add_clauses, add_requirements, add_rules
+from regulationcoder.audit.logger import AuditLogger
+from regulationcoder.core.config import get_settings
+from regulationcoder.core.engine import ComplianceEngine
+from regulationcoder.rules.eu_ai_act_v1 import (
+    get_clauses,
+    get_regulation,
+    get_requirements,
+    get_rules,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,36 +35,34 @@ logger = logging.getLogger(__name__)
 # These dictionaries are shared across routers via app.state.
 # For the MVP this replaces a database.
 
-_store: dict = {
+# Upper bound on in-memory audit entries; the oldest are evicted first.
+_AUDIT_ENTRIES_MAXLEN = 100_000
+
+
+_store: Store = {
     "regulations": {},
     "clauses": {},
     "requirements": {},
     "rules": {},
     "reports": {},
-    "audit_entries": [],
+    # Secondary indexes: regulation ID -> {id: model}; see api/store.py
+    "clauses_by_reg": {},
+    "requirements_by_reg": {},
+    "rules_by_reg_prefix": {},
+    # Bumped on every write; feeds the ETag of store-backed GET responses
+    "version": 0,
+    "audit_entries": deque(maxlen=_AUDIT_ENTRIES_MAXLEN),
 }
 
 
-def _bootstrap_eu_ai_act(store: dict) -> None:
+def _bootstrap_eu_ai_act(store: Store) -> None:
     """Pre-load the EU AI Act data into the in-memory store."""
-    from regulationcoder.rules.eu_ai_act_v1 import (
-        get_clauses,
-        get_regulation,
-        get_requirements,
-        get_rules,
-    )
-
     reg = get_regulation()
     store["regulations"][reg.id] = reg
 
-    for clause in get_clauses():
-        store["clauses"][clause.id] = clause
-
-    for req in get_requirements():
-        store["requirements"][req.id] = req
-
-    for rule in get_rules():
-        store["rules"][rule.id] = rule
+    add_clauses(store, get_clauses())
+    add_requirements(store, get_requirements())
+    add_rules(store, get_rules())
 
     logger.info(
         "Bootstrapped EU AI Act: %d clauses, %d requirements, %d rules",
@@ -63,9 +77,17 @@ async def lifespan(app: FastAPI):
     """Application lifespan — load seed data on startup."""
     _bootstrap_eu_ai_act(_store)
     app.state.store = _store
+    # One engine per regulation, shared by all requests: engines only hold
+    # the immutable rule set, so concurrent evaluations are safe.
+    app.state.engines = {"eu-ai-act-v1": ComplianceEngine(regulation="eu-ai-act-v1")}
+    # The only writer of the app's audit log: pipeline runs started by the
+    # API log through it, so the hash chain has a single head.
+    audit_logger = AuditLogger(log_dir=get_settings().audit_log_dir)
+    app.state.audit_logger = audit_logger
     logger.info("RegulationCoder API started")
     yield
     logger.info("RegulationCoder API shutting down")
+    audit_logger.close()
 
 
 # ---------------------------------------------------------------------------
@@ -92,6 +114,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ---------------------------------------------------------------------------
+# Conditional GETs for store-backed endpoints
+# ---------------------------------------------------------------------------
+
+# GET responses under these prefixes depend only on the in-memory store, so a
+# weak ETag made of the process's boot ID and the store version validates
+# them. Clients re-sending it in If-None-Match get an empty 304 instead of a
+# re-serialized payload.
+_ETAG_PATH_PREFIXES = (
+    "/api/regulations",
+    "/api/requirements",
+    "/api/rules",
+    "/api/evaluate/reports",
+)
+_BOOT_ID = uuid.uuid4().hex[:12]
+
+
+@app.middleware("http")
+async def store_etag(request: Request, call_next):
+    """Answer unchanged store-backed GETs with 304 Not Modified."""
+    if request.method != "GET" or not request.url.path.startswith(_ETAG_PATH_PREFIXES):
+        return await call_next(request)
+
+    etag = f'W/"{_BOOT_ID}-{request.app.state.store["version"]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
+
+
+@app.middleware("http")
+async def reject_oversized_upload(request: Request, call_next):
+    """Refuse uploads whose declared size is over the limit before reading them.
+
+    FastAPI parses the multipart body before the upload handler runs, so the
+    check has to happen here to avoid spooling an oversized body at all.
+    """
+    if request.method == "POST" and request.url.path.startswith(upload.router.prefix):
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > upload.MAX_UPLOAD_REQUEST_BYTES:
+            return JSONResponse(status_code=413, content={"detail": upload.TOO_LARGE_DETAIL})
+    return await call_next(request)
+
+
 # Include routers
 app.include_router(regulations.router)
 app.include_router(requirements.router)
@@ -105,15 +176,36 @@ app.include_router(audit.router)
 # Health check
 # ---------------------------------------------------------------------------
 
-@app.get("/health", tags=["system"])
+# (epoch second, ISO string) — health checks re-format the time at most once a second
+_health_timestamp: tuple[int, str] = (0, "")
+
+
+def _current_health_timestamp() -> str:
+    """Return the current UTC time as ISO-8601, truncated to whole seconds."""
+    global _health_timestamp
+    now = int(time.time())
+    if now != _health_timestamp[0]:
+        _health_timestamp = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _health_timestamp[1]
+
+
+class HealthStatus(BaseModel):
+    """Response body of the health check endpoint."""
+    status: str
+    service: str
+    version: str
+    timestamp: str
+
+
+@app.get("/health", response_model=HealthStatus, tags=["system"])
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "RegulationCoder API",
-        "version": "0.1.0",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    return HealthStatus(
+        status="healthy",
+        service="RegulationCoder API",
+        version="0.1.0",
+        timestamp=_current_health_timestamp(),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -124,24 +216,33 @@ class PipelineConnectionManager:
     """Manages active WebSocket connections for pipeline progress streaming."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def send_progress(self, websocket: WebSocket, data: dict):
         await websocket.send_json(data)
 
     async def broadcast(self, data: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(data)
-            except Exception:
-                pass
+        """Send *data* to all clients concurrently, dropping any that fail.
+
+        The payload is encoded once and sent as a text frame, matching what
+        ``send_json`` would produce for each client.
+        """
+        payload = orjson.dumps(data).decode("utf-8")
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 pipeline_manager = PipelineConnectionManager()
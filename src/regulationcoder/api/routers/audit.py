@@ -1,15 +1,84 @@
 """Audit router — query audit trail and verify hash-chain integrity."""
 
+import heapq
+import os
+from collections.abc import Collection
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from fastapi import APIRouter, Query, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Query, Request, Response
+from pydantic import BaseModel, TypeAdapter
 
+from regulationcoder.api.store import Store
 from regulationcoder.audit.logger import AuditLogger
 from regulationcoder.models.audit_entry import AuditAction, AuditEntry
 
 router = APIRouter(prefix="/api/audit", tags=["audit"])
 
+# Built once; /logs dumps its result directly instead of letting FastAPI
+# re-validate the outbound list against a response_model on every request.
+_AUDIT_ENTRY_LIST = TypeAdapter(list[AuditEntry])
+
+@dataclass
+class _CachedLog:
+    """Parsed audit log plus inverted indices (value -> entry positions)."""
+
+    mtime_ns: int
+    size: int
+    entries: list[AuditEntry]
+    by_action: dict[AuditAction, list[int]] = field(default_factory=dict)
+    by_stage: dict[str, list[int]] = field(default_factory=dict)
+    by_actor: dict[str, list[int]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for i, entry in enumerate(self.entries):
+            self.by_action.setdefault(entry.action, []).append(i)
+            self.by_stage.setdefault(entry.stage, []).append(i)
+            self.by_actor.setdefault(entry.actor, []).append(i)
+
+
+_EMPTY_LOG = _CachedLog(mtime_ns=0, size=0, entries=[])
+
+# The app log, parsed and keyed by file path, rebuilt when the file's
+# (mtime, size) changes. Avoids re-reading the whole JSONL on every request.
+# Only the app logger's file is cached, so this holds at most one entry.
+_entries_cache: dict[str, _CachedLog] = {}
+
+
+def _load_entries_cached(audit_logger: AuditLogger) -> _CachedLog:
+    """Return the parsed log for the logger's file, re-parsing only when it has changed.
+
+    The returned object is shared between requests and must not be mutated.
+    """
+    log_file = audit_logger.log_file
+    try:
+        stat = os.stat(log_file)
+    except FileNotFoundError:
+        _entries_cache.pop(log_file, None)
+        return _EMPTY_LOG
+
+    cached = _entries_cache.get(log_file)
+    if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+        return cached
+
+    cached = _CachedLog(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        entries=audit_logger.load_from_file(),
+    )
+    _entries_cache.clear()
+    _entries_cache[log_file] = cached
+    return cached
+
+
+def _load_entries(request: Request, log_dir: str) -> list[AuditEntry]:
+    """Load the entries in *log_dir*, using the cache only for the app's own log."""
+    audit_logger: AuditLogger = request.app.state.audit_logger
+    if os.path.abspath(log_dir) == os.path.abspath(audit_logger.log_dir):
+        return _load_entries_cached(audit_logger).entries
+    # Caller-supplied directories are read fresh so they cannot grow the cache
+    return AuditLogger(log_dir=log_dir).load_from_file()
+
 
 class AuditVerificationResult(BaseModel):
     """Result of an audit hash-chain verification."""
@@ -20,7 +89,11 @@ class AuditVerificationResult(BaseModel):
     last_entry_time: str | None = None
 
 
-@router.get("/logs", response_model=list[AuditEntry])
+@router.get(
+    "/logs",
+    response_class=Response,
+    responses={200: {"model": list[AuditEntry], "content": {"application/json": {}}}},
+)
 async def list_audit_logs(
     request: Request,
     action: AuditAction | None = Query(None, description="Filter by action type"),
@@ -33,30 +106,41 @@ async def list_audit_logs(
 
     Entries are returned in reverse chronological order (most recent first).
     """
-    store = request.app.state.store
-    entries: list[AuditEntry] = list(store.get("audit_entries", []))
+    store: Store = request.app.state.store
+    entries: Collection[AuditEntry] = store.get("audit_entries", ())
 
-    # Also try loading from the default audit log file
+    # Also try loading from the default audit log file, narrowing the scan to
+    # the shortest matching posting list when filtering by action/stage/actor
     if not entries:
         try:
-            audit_logger = AuditLogger(log_dir="./audit_logs")
-            entries = audit_logger.load_from_file()
+            log = _load_entries_cached(request.app.state.audit_logger)
         except Exception:
-            entries = []
-
-    # Apply filters
-    if action is not None:
-        entries = [e for e in entries if e.action == action]
-    if stage is not None:
-        entries = [e for e in entries if e.stage == stage]
-    if actor is not None:
-        entries = [e for e in entries if e.actor == actor]
-    if since is not None:
-        entries = [e for e in entries if e.timestamp >= since]
+            log = _EMPTY_LOG
+        postings: list[list[int]] = []
+        if action is not None:
+            postings.append(log.by_action.get(action, []))
+        if stage is not None:
+            postings.append(log.by_stage.get(stage, []))
+        if actor is not None:
+            postings.append(log.by_actor.get(actor, []))
+        if postings:
+            entries = [log.entries[i] for i in min(postings, key=len)]
+        else:
+            entries = log.entries
+
+    # Apply all filters in a single pass
+    filtered = (
+        e
+        for e in entries
+        if (action is None or e.action == action)
+        and (stage is None or e.stage == stage)
+        and (actor is None or e.actor == actor)
+        and (since is None or e.timestamp >= since)
+    )
 
-    # Sort by timestamp descending and apply limit
-    entries.sort(key=lambda e: e.timestamp, reverse=True)
-    return entries[:limit]
+    # Most recent first; nlargest only keeps `limit` entries instead of sorting all
+    result = heapq.nlargest(limit, filtered, key=lambda e: e.timestamp)
+    return Response(content=_AUDIT_ENTRY_LIST.dump_json(result), media_type="application/json")
 
 
 @router.get("/verify", response_model=AuditVerificationResult)
@@ -72,8 +156,7 @@ async def verify_audit_chain(
     flagged.
     """
     try:
-        audit_logger = AuditLogger(log_dir=log_dir)
-        entries = audit_logger.load_from_file()
+        entries = _load_entries(request, log_dir)
     except Exception as e:
         return AuditVerificationResult(
             is_valid=False,
@@ -1,11 +1,15 @@
 """Evaluate router — run compliance evaluations and retrieve reports."""
 
-import asyncio
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timezone
 
-from fastapi import APIRouter, Body, HTTPException, Request
+from fastapi import APIRouter, Body, HTTPException, Request, Response
+from pydantic import TypeAdapter
 
+from regulationcoder.api.store import Store, add_report
 from regulationcoder.core.ai_analyzer import ComplianceAnalyzer
-from regulationcoder.core.config import get_settings
+from regulationcoder.core.config import Settings, get_settings
 from regulationcoder.core.engine import ComplianceEngine
 from regulationcoder.models.ai_analysis import AIAnalysisResponse
 from regulationcoder.models.evaluation import ComplianceReport
@@ -13,6 +17,23 @@ from regulationcoder.models.profile import SystemProfile
 
 router = APIRouter(prefix="/api/evaluate", tags=["evaluate"])
 
+_REGULATION_ID = "eu-ai-act-v1"
+
+# Built once; /reports dumps the stored reports directly instead of letting
+# FastAPI re-validate each one against a response_model on every request.
+_REPORT_LIST = TypeAdapter(list[ComplianceReport])
+
+# Evaluation is deterministic in the profile, so results are memoized per
+# profile digest (least recently used evicted first). Only the report ID and
+# evaluation date are refreshed on a hit. Hits return a deep copy, since a
+# shallow one would share the result and gap lists with the cached report.
+_EVALUATION_CACHE_SIZE = 512
+_evaluation_cache: OrderedDict[str, ComplianceReport] = OrderedDict()
+
+# Shared analyzer so concurrent /ai-analysis calls reuse one connection pool;
+# rebuilt if the settings it was created from change.
+_analyzer: ComplianceAnalyzer | None = None
+
 _EXAMPLE_PROFILE = {
     "system_name": "TalentScreen AI",
     "provider_name": "TalentTech GmbH",
@@ -57,6 +78,42 @@ _EXAMPLE_PROFILE = {
 }
 
 
+def _get_analyzer(settings: Settings) -> ComplianceAnalyzer:
+    """Return the shared ComplianceAnalyzer for *settings*."""
+    global _analyzer
+    if _analyzer is None or _analyzer.settings != settings:
+        _analyzer = ComplianceAnalyzer(settings)
+    return _analyzer
+
+
+def _profile_digest(profile: SystemProfile) -> str:
+    """Return a short, stable digest of *profile* used as the cache key."""
+    payload = profile.model_dump_json().encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _evaluate(engine: ComplianceEngine, profile: SystemProfile) -> ComplianceReport:
+    """Evaluate *profile*, reusing a cached result for an identical profile."""
+    key = _profile_digest(profile)
+    cached = _evaluation_cache.get(key)
+    if cached is None:
+        report = engine.evaluate(profile)
+        _evaluation_cache[key] = report
+        if len(_evaluation_cache) > _EVALUATION_CACHE_SIZE:
+            _evaluation_cache.popitem(last=False)
+        return report
+
+    _evaluation_cache.move_to_end(key)
+    now = datetime.now(timezone.utc)
+    return cached.model_copy(
+        deep=True,
+        update={
+            "id": f"RPT-{_REGULATION_ID}-{now.strftime('%Y%m%d%H%M%S')}",
+            "evaluation_date": now,
+        }
+    )
+
+
 @router.post("/", response_model=ComplianceReport)
 async def evaluate_profile(
     profile: SystemProfile = Body(..., openapi_examples={"TalentScreen AI (demo)": {"summary": "TalentScreen AI - recruitment system (partial compliance expected)", "value": _EXAMPLE_PROFILE}}),
@@ -67,14 +124,13 @@ async def evaluate_profile(
     Accepts a SystemProfile JSON body and returns a full ComplianceReport
     including per-rule verdicts, compliance gaps, and an overall score.
     """
-    store = request.app.state.store
+    store: Store = request.app.state.store
 
     # Use the default EU AI Act regulation
-    engine = ComplianceEngine(regulation="eu-ai-act-v1")
-    report = engine.evaluate(profile)
+    report = _evaluate(request.app.state.engines[_REGULATION_ID], profile)
 
     # Store the report for later retrieval
-    store["reports"][report.id] = report
+    add_report(store, report)
 
     return report
 
@@ -91,19 +147,18 @@ async def ai_analysis(
     plain-language explanations and prioritised recommendations.
     """
     settings = get_settings()
-    store = request.app.state.store
+    store: Store = request.app.state.store
 
     # Step 1 — deterministic evaluation
-    engine = ComplianceEngine(regulation="eu-ai-act-v1")
-    report = engine.evaluate(profile)
+    report = _evaluate(request.app.state.engines[_REGULATION_ID], profile)
 
     # Step 2 — store the report
-    store["reports"][report.id] = report
+    add_report(store, report)
 
-    # Step 3 — AI analysis via Claude Opus 4.6 (run in thread to not block event loop)
+    # Step 3 — AI analysis via Claude Opus 4.6, awaited on the event loop
     try:
-        analyzer = ComplianceAnalyzer(settings)
-        analysis = await asyncio.to_thread(analyzer.analyze, profile, report)
+        analyzer = _get_analyzer(settings)
+        analysis = await analyzer.analyze_async(profile, report)
     except Exception as exc:
         raise HTTPException(
             status_code=503,
@@ -121,17 +176,22 @@ async def ai_analysis(
     )
 
 
-@router.get("/reports", response_model=list[ComplianceReport])
+@router.get(
+    "/reports",
+    response_class=Response,
+    responses={200: {"model": list[ComplianceReport], "content": {"application/json": {}}}},
+)
 async def list_reports(request: Request):
     """List all previously generated compliance reports."""
-    store = request.app.state.store
-    return list(store["reports"].values())
+    store: Store = request.app.state.store
+    reports = list(store["reports"].values())
+    return Response(content=_REPORT_LIST.dump_json(reports), media_type="application/json")
 
 
 @router.get("/reports/{report_id}", response_model=ComplianceReport)
 async def get_report(report_id: str, request: Request):
     """Get a specific compliance report by ID."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
     report = store["reports"].get(report_id)
     if report is None:
         raise HTTPException(status_code=404, detail=f"Report '{report_id}' not found")
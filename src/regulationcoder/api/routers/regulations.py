@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, HTTPException, Request
 
+from regulationcoder.api.store import Store
 from regulationcoder.models.clause import Clause
 from regulationcoder.models.regulation import Regulation
 
@@ -11,14 +12,14 @@ router = APIRouter(prefix="/api/regulations", tags=["regulations"])
 @router.get("/", response_model=list[Regulation])
 async def list_regulations(request: Request):
     """List all available regulations."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
     return list(store["regulations"].values())
 
 
 @router.get("/{regulation_id}", response_model=Regulation)
 async def get_regulation(regulation_id: str, request: Request):
     """Get details of a specific regulation."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
     reg = store["regulations"].get(regulation_id)
     if reg is None:
         raise HTTPException(status_code=404, detail=f"Regulation '{regulation_id}' not found")
@@ -28,24 +29,19 @@ async def get_regulation(regulation_id: str, request: Request):
 @router.get("/{regulation_id}/clauses", response_model=list[Clause])
 async def list_clauses(regulation_id: str, request: Request):
     """List all clauses for a regulation."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
 
     # Verify the regulation exists
     if regulation_id not in store["regulations"]:
         raise HTTPException(status_code=404, detail=f"Regulation '{regulation_id}' not found")
 
-    clauses = [
-        clause
-        for clause in store["clauses"].values()
-        if clause.regulation_id == regulation_id
-    ]
-    return clauses
+    return list(store["clauses_by_reg"].get(regulation_id, {}).values())
 
 
 @router.get("/{regulation_id}/clauses/{clause_id:path}", response_model=Clause)
 async def get_clause(regulation_id: str, clause_id: str, request: Request):
     """Get a specific clause by ID."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
 
     if regulation_id not in store["regulations"]:
         raise HTTPException(status_code=404, detail=f"Regulation '{regulation_id}' not found")
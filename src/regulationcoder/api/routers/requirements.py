@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, HTTPException, Query, Request
 
+from regulationcoder.api.store import Store
 from regulationcoder.models.requirement import Requirement
 
 router = APIRouter(prefix="/api/requirements", tags=["requirements"])
@@ -17,25 +18,32 @@ async def list_requirements(
     The regulation_id filter matches against the clause_id prefix, since
     requirements reference clauses which belong to a regulation.
     """
-    store = request.app.state.store
-    requirements = list(store["requirements"].values())
-
-    if regulation_id:
-        # Clause IDs start with the regulation ID, e.g. "eu-ai-act-v1/art10/..."
-        # Match if the clause_id starts with the regulation_id
-        requirements = [
+    store: Store = request.app.state.store
+    if not regulation_id:
+        return list(store["requirements"].values())
+
+    # Clause IDs start with the regulation ID, e.g. "eu-ai-act-v1/art10/...",
+    # so only the buckets of regulations sharing the prefix can match.
+    by_reg: dict[str, dict[str, Requirement]] = store["requirements_by_reg"]
+    reg_prefix, sep, _ = regulation_id.partition("/")
+    if sep:
+        return [
             req
-            for req in requirements
+            for req in by_reg.get(reg_prefix, {}).values()
             if req.clause_id.startswith(regulation_id)
         ]
-
-    return requirements
+    return [
+        req
+        for reg_id, bucket in by_reg.items()
+        if reg_id.startswith(regulation_id)
+        for req in bucket.values()
+    ]
 
 
 @router.get("/{requirement_id}", response_model=Requirement)
 async def get_requirement(requirement_id: str, request: Request):
     """Get a specific requirement by ID."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
     req = store["requirements"].get(requirement_id)
     if req is None:
         raise HTTPException(
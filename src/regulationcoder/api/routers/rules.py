@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, HTTPException, Query, Request
 
+from regulationcoder.api.store import Store
 from regulationcoder.models.rule import Rule
 
 router = APIRouter(prefix="/api/rules", tags=["rules"])
@@ -17,25 +18,25 @@ async def list_rules(
     The regulation_id filter matches against the rule ID prefix. For example,
     rules for the EU AI Act have IDs like ``RULE-EU-AI-ACT-...``.
     """
-    store = request.app.state.store
-    all_rules = list(store["rules"].values())
+    store: Store = request.app.state.store
+    if not regulation_id:
+        return list(store["rules"].values())
 
-    if regulation_id:
-        # Normalize: "eu-ai-act" -> "EU-AI-ACT" for matching rule ID prefix
-        normalized = regulation_id.upper().replace("-", "-")
-        all_rules = [
-            rule
-            for rule in all_rules
-            if normalized in rule.id.upper()
-        ]
-
-    return all_rules
+    # "eu-ai-act" -> "EU-AI-ACT", matched against each bucket's rule ID prefix
+    normalized = regulation_id.upper()
+    by_prefix: dict[str, dict[str, Rule]] = store["rules_by_reg_prefix"]
+    return [
+        rule
+        for prefix, bucket in by_prefix.items()
+        if prefix.startswith(normalized)
+        for rule in bucket.values()
+    ]
 
 
 @router.get("/{rule_id}", response_model=Rule)
 async def get_rule(rule_id: str, request: Request):
     """Get a specific rule by ID."""
-    store = request.app.state.store
+    store: Store = request.app.state.store
     rule = store["rules"].get(rule_id)
     if rule is None:
         raise HTTPException(status_code=404, detail=f"Rule '{rule_id}' not found")
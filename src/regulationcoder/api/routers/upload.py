@@ -1,5 +1,6 @@
 """Upload router — upload regulation documents for ingestion."""
 
+import asyncio
 import logging
 import os
 import tempfile
@@ -8,10 +9,26 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, Request, UploadFile
 from pydantic import BaseModel
 
+from regulationcoder.api.store import add_clauses
+from regulationcoder.audit.logger import AuditLogger
+from regulationcoder.models.clause import Clause
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/upload", tags=["upload"])
 
+_ALLOWED_EXTENSIONS = (".pdf", ".html", ".htm", ".txt")
+
+# Uploads are copied to disk in chunks of this size rather than read whole
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Largest accepted document. Requests whose Content-Length exceeds it (plus
+# room for the multipart envelope) are refused before the body is read; see
+# reject_oversized_upload in api/app.py.
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+MAX_UPLOAD_REQUEST_BYTES = MAX_UPLOAD_BYTES + 64 * 1024
+TOO_LARGE_DETAIL = f"File too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB"
+
 
 class UploadResponse(BaseModel):
     """Response returned after a document upload."""
@@ -25,6 +42,17 @@ class UploadResponse(BaseModel):
     timestamp: str
 
 
+def _ingest_and_parse(
+    file_path: str, regulation_id: str, version: str, audit_logger: AuditLogger
+) -> list[Clause]:
+    """Run the ingestion and parsing pipeline stages on a saved upload."""
+    from regulationcoder.core.pipeline import PipelineOrchestrator
+
+    orchestrator = PipelineOrchestrator(audit_logger=audit_logger)
+    text = orchestrator.run_ingestion(file_path)
+    return orchestrator.run_parsing(text, regulation_id, version)
+
+
 @router.post("/", response_model=UploadResponse)
 async def upload_regulation(
     file: UploadFile,
@@ -46,40 +74,43 @@ async def upload_regulation(
     if file.filename is None:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    allowed_extensions = (".pdf", ".html", ".htm", ".txt")
     file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in allowed_extensions:
+    if file_ext not in _ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type '{file_ext}'. Allowed: {', '.join(allowed_extensions)}",
+            detail=f"Unsupported file type '{file_ext}'. Allowed: {', '.join(_ALLOWED_EXTENSIONS)}",
         )
 
-    # Read file content
-    content = await file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
-    # Save to temporary file
+    # Stream the upload to a temporary file chunk by chunk
     suffix = file_ext
+    file_size = 0
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(content)
         tmp_path = tmp.name
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > MAX_UPLOAD_BYTES:
+                break
+            tmp.write(chunk)
+
+    if file_size > MAX_UPLOAD_BYTES:
+        os.unlink(tmp_path)
+        raise HTTPException(status_code=413, detail=TOO_LARGE_DETAIL)
+    if not file_size:
+        os.unlink(tmp_path)
+        raise HTTPException(status_code=400, detail="Empty file uploaded")
 
     try:
-        from regulationcoder.core.pipeline import PipelineOrchestrator
-
-        orchestrator = PipelineOrchestrator()
-
-        # Run ingestion
-        text = orchestrator.run_ingestion(tmp_path)
-
-        # Run parsing
-        clauses = orchestrator.run_parsing(text, regulation_id, version)
+        # Ingestion and parsing are blocking; run them off the event loop
+        clauses = await asyncio.to_thread(
+            _ingest_and_parse,
+            tmp_path,
+            regulation_id,
+            version,
+            request.app.state.audit_logger,
+        )
 
         # Add clauses to the in-memory store
-        store = request.app.state.store
-        for clause in clauses:
-            store["clauses"][clause.id] = clause
+        add_clauses(request.app.state.store, clauses)
 
         logger.info(
             "Uploaded and processed %s: %d clauses extracted",
@@ -91,7 +122,7 @@ async def upload_regulation(
             status="success",
             message=f"Document processed successfully. Extracted {len(clauses)} clauses.",
             file_name=file.filename,
-            file_size=len(content),
+            file_size=file_size,
             clauses_extracted=len(clauses),
             regulation_id=regulation_id,
             version=version,
@@ -0,0 +1,104 @@
+"""Write helpers for the in-memory API store.
+
+Besides the primary ``id -> model`` dicts, the store keeps secondary indexes
+bucketed by regulation so list endpoints return their rows without scanning
+the whole corpus. Every insertion goes through these helpers so the indexes
+never drift from the primary dicts, and bumps ``store["version"]`` so HTTP
+validators (ETags) derived from it change whenever the data does.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from typing import TypedDict
+
+from regulationcoder.models.audit_entry import AuditEntry
+from regulationcoder.models.clause import Clause
+from regulationcoder.models.evaluation import ComplianceReport
+from regulationcoder.models.regulation import Regulation
+from regulationcoder.models.requirement import Requirement
+from regulationcoder.models.rule import Rule
+
+
+class Store(TypedDict):
+    """Shape of the in-memory store shared by the routers via ``app.state.store``."""
+
+    regulations: dict[str, Regulation]
+    clauses: dict[str, Clause]
+    requirements: dict[str, Requirement]
+    rules: dict[str, Rule]
+    reports: dict[str, ComplianceReport]
+    # Secondary indexes: regulation ID (or rule prefix) -> {id: model}
+    clauses_by_reg: dict[str, dict[str, Clause]]
+    requirements_by_reg: dict[str, dict[str, Requirement]]
+    rules_by_reg_prefix: dict[str, dict[str, Rule]]
+    version: int
+    audit_entries: deque[AuditEntry]
+
+
+def requirement_regulation_id(requirement: Requirement) -> str:
+    """Return the regulation segment of a requirement's clause ID.
+
+    Clause IDs start with the regulation ID, e.g. ``"eu-ai-act-v1/art10/..."``.
+    """
+    return requirement.clause_id.split("/", 1)[0]
+
+
+def rule_regulation_prefix(rule: Rule) -> str:
+    """Return the upper-cased regulation prefix of a rule ID.
+
+    Rule IDs have the form ``RULE-<REGULATION>-<ARTICLE>-<PARAGRAPH>-<SEQ>``,
+    e.g. ``"RULE-EU-AI-ACT-010-02F-001"`` -> ``"EU-AI-ACT"``.
+    """
+    rule_id = rule.id.upper().removeprefix("RULE-")
+    return rule_id.rsplit("-", 3)[0]
+
+
+def bump_version(store: Store) -> None:
+    """Record that the store's contents changed."""
+    store["version"] += 1
+
+
+def add_clauses(store: Store, clauses: Iterable[Clause]) -> None:
+    """Insert *clauses* into the store and the per-regulation clause index."""
+    primary = store["clauses"]
+    by_reg = store["clauses_by_reg"]
+    for clause in clauses:
+        previous = primary.get(clause.id)
+        if previous is not None and previous.regulation_id != clause.regulation_id:
+            by_reg.get(previous.regulation_id, {}).pop(clause.id, None)
+        primary[clause.id] = clause
+        by_reg.setdefault(clause.regulation_id, {})[clause.id] = clause
+    bump_version(store)
+
+
+def add_requirements(store: Store, requirements: Iterable[Requirement]) -> None:
+    """Insert *requirements* into the store and the per-regulation requirement index."""
+    primary = store["requirements"]
+    by_reg = store["requirements_by_reg"]
+    for req in requirements:
+        reg_id = requirement_regulation_id(req)
+        previous = primary.get(req.id)
+        if previous is not None:
+            previous_reg_id = requirement_regulation_id(previous)
+            if previous_reg_id != reg_id:
+                by_reg.get(previous_reg_id, {}).pop(req.id, None)
+        primary[req.id] = req
+        by_reg.setdefault(reg_id, {})[req.id] = req
+    bump_version(store)
+
+
+def add_rules(store: Store, rules: Iterable[Rule]) -> None:
+    """Insert *rules* into the store and the per-regulation-prefix rule index."""
+    primary = store["rules"]
+    by_prefix = store["rules_by_reg_prefix"]
+    for rule in rules:
+        prefix = rule_regulation_prefix(rule)
+        primary[rule.id] = rule
+        by_prefix.setdefault(prefix, {})[rule.id] = rule
+    bump_version(store)
+
+
+def add_report(store: Store, report: ComplianceReport) -> None:
+    """Insert a compliance report into the store."""
+    store["reports"][report.id] = report
+    bump_version(store)
@@ -5,7 +5,9 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Any
+from typing import Any, BinaryIO
+
+import orjson
 
 from regulationcoder.models.audit_entry import AuditAction, AuditEntry
 
@@ -13,6 +15,16 @@ logger = logging.getLogger(__name__)
 
 _GENESIS_HASH = "0" * 64
 
+# Written next to audit.jsonl by verify(use_checkpoint=True)
+_CHECKPOINT_FILE = "audit.verified.json"
+_EMPTY_CHECKPOINT: dict[str, Any] = {
+    "offset": 0,
+    "lines": 0,
+    "entries": 0,
+    "last_hash": _GENESIS_HASH,
+}
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+
 
 class AuditChainVerifier:
     """Verify the hash chain of an audit JSONL log file.
@@ -25,13 +37,28 @@ class AuditChainVerifier:
     (or the genesis hash ``"0" * 64`` for the first entry).
     """
 
-    def verify(self, log_dir: str) -> tuple[bool, list[str]]:
+    def verify(
+        self,
+        log_dir: str,
+        fast_mode: bool = False,
+        use_checkpoint: bool = False,
+    ) -> tuple[bool, list[str]]:
         """Verify the full chain in the audit log.
 
         Parameters
         ----------
         log_dir:
             Directory containing the ``audit.jsonl`` file.
+        fast_mode:
+            Only check ``previous_hash`` linkage between entries, without
+            recomputing each ``entry_hash``. Catches removed or reordered
+            entries but not edits to an entry's content.
+        use_checkpoint:
+            Resume from ``audit.verified.json``, written by the last full
+            (non-fast) successful run with this flag. It records the length,
+            SHA-256 digest, and final entry hash of the verified prefix of
+            the log; when the file still starts with exactly those bytes,
+            only the entries appended since are parsed and re-hashed.
 
         Returns
         -------
@@ -47,29 +74,44 @@ class AuditChainVerifier:
             errors.append(f"Audit log file not found: {log_file}")
             return False, errors
 
+        checkpoint_file = os.path.join(log_dir, _CHECKPOINT_FILE)
+        checkpoint, prefix_digest = _EMPTY_CHECKPOINT, hashlib.sha256()
+        with open(log_file, "rb") as fh:
+            if use_checkpoint:
+                checkpoint, prefix_digest = self._load_checkpoint(checkpoint_file, fh)
+            fh.seek(checkpoint["offset"])
+            tail = fh.read()
+
+        # Only newline-terminated lines can extend the checkpointed prefix; a
+        # trailing partial line is still verified but may be mid-write.
+        complete_len = tail.rfind(b"\n") + 1
+        lines = tail[:complete_len].split(b"\n")[:-1]
+        lines.append(tail[complete_len:])
+
         entries: list[dict[str, Any]] = []
-        with open(log_file, "r", encoding="utf-8") as fh:
-            for line_no, line in enumerate(fh, start=1):
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                try:
-                    entry = json.loads(stripped)
-                    entries.append(entry)
-                except json.JSONDecodeError as exc:
-                    errors.append(f"Line {line_no}: invalid JSON — {exc}")
+        for line_no, line in enumerate(lines, start=checkpoint["lines"] + 1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            try:
+                entry = orjson.loads(stripped)
+                entries.append(entry)
+            except orjson.JSONDecodeError as exc:
+                errors.append(f"Line {line_no}: invalid JSON — {exc}")
+        complete_entries = len(entries) - bool(lines[-1].strip())
 
         if not entries and not errors:
-            # Empty log is technically valid
+            # Empty log (or nothing appended since the checkpoint) is valid
             return True, []
 
         if errors:
             # JSON parse errors already found
             return False, errors
 
-        expected_previous = _GENESIS_HASH
+        expected_previous = checkpoint["last_hash"]
+        compute_hash = self._compute_hash
 
-        for idx, entry in enumerate(entries):
+        for idx, entry in enumerate(entries, start=checkpoint["entries"]):
             entry_id = entry.get("id", f"<index {idx}>")
             stored_previous = entry.get("previous_hash", "")
             stored_hash = entry.get("entry_hash", "")
@@ -83,41 +125,56 @@ class AuditChainVerifier:
                 )
 
             # 2. Recompute hash and compare
-            try:
-                action_value = entry.get("action", "")
-                timestamp_str = entry.get("timestamp", "")
-                target_ids = entry.get("target_ids", [])
-                details = entry.get("details", {})
-
-                computed = self._compute_hash(
-                    previous_hash=stored_previous,
-                    timestamp_iso=timestamp_str,
-                    action_value=action_value,
-                    target_ids=target_ids,
-                    details=details,
-                )
+            if not fast_mode:
+                try:
+                    computed = compute_hash(
+                        previous_hash=stored_previous,
+                        timestamp_iso=entry.get("timestamp", ""),
+                        action_value=entry.get("action", ""),
+                        target_ids=entry.get("target_ids", []),
+                        details=entry.get("details", {}),
+                    )
 
-                if computed != stored_hash:
+                    if computed != stored_hash:
+                        errors.append(
+                            f"Entry {entry_id} (index {idx}): entry_hash mismatch. "
+                            f"Computed '{computed[:16]}...', "
+                            f"stored '{stored_hash[:16]}...'."
+                        )
+                except Exception as exc:
                     errors.append(
-                        f"Entry {entry_id} (index {idx}): entry_hash mismatch. "
-                        f"Computed '{computed[:16]}...', "
-                        f"stored '{stored_hash[:16]}...'."
+                        f"Entry {entry_id} (index {idx}): failed to recompute hash — {exc}"
                     )
-            except Exception as exc:
-                errors.append(
-                    f"Entry {entry_id} (index {idx}): failed to recompute hash — {exc}"
-                )
 
             # Advance the chain
             expected_previous = stored_hash
 
+        total = checkpoint["entries"] + len(entries)
         is_valid = len(errors) == 0
         if is_valid:
-            logger.info("Audit chain verified: %d entries, all valid.", len(entries))
+            logger.info("Audit chain verified: %d entries, all valid.", total)
+            # A linkage-only pass does not vouch for entry contents
+            if use_checkpoint and not fast_mode and complete_len:
+                prefix_digest.update(tail[:complete_len])
+                last_hash = (
+                    entries[complete_entries - 1]["entry_hash"]
+                    if complete_entries
+                    else checkpoint["last_hash"]
+                )
+                self._save_checkpoint(
+                    checkpoint_file,
+                    {
+                        "offset": checkpoint["offset"] + complete_len,
+                        "lines": checkpoint["lines"] + len(lines) - 1,
+                        "entries": checkpoint["entries"] + complete_entries,
+                        "last_hash": last_hash,
+                        "sha256": prefix_digest.hexdigest(),
+                    },
+                )
         else:
             logger.warning(
                 "Audit chain verification failed: %d entries, %d errors.",
-                len(entries),
+                total,
                 len(errors),
             )
         return is_valid, errors
@@ -126,6 +183,45 @@ class AuditChainVerifier:
     # Internal
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _load_checkpoint(checkpoint_file: str, fh: BinaryIO) -> tuple[dict[str, Any], Any]:
+        """Return the saved checkpoint and a SHA-256 hasher fed with its prefix.
+
+        Falls back to the empty checkpoint (full verification) when the
+        checkpoint is missing, unreadable, or the log no longer starts with
+        the bytes it describes.
+        """
+        try:
+            with open(checkpoint_file, "rb") as cfh:
+                checkpoint = orjson.loads(cfh.read())
+            prefix_digest = hashlib.sha256()
+            remaining = checkpoint["offset"]
+            while remaining > 0:
+                chunk = fh.read(min(remaining, _DIGEST_CHUNK_SIZE))
+                if not chunk:
+                    break
+                prefix_digest.update(chunk)
+                remaining -= len(chunk)
+            if remaining == 0 and prefix_digest.hexdigest() == checkpoint["sha256"]:
+                return checkpoint, prefix_digest
+            logger.warning("Audit checkpoint does not match the log; verifying in full.")
+        except FileNotFoundError:
+            pass
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError) as exc:
+            logger.warning("Ignoring unreadable audit checkpoint: %s", exc)
+        return _EMPTY_CHECKPOINT, hashlib.sha256()
+
+    @staticmethod
+    def _save_checkpoint(checkpoint_file: str, checkpoint: dict[str, Any]) -> None:
+        """Atomically replace the checkpoint file."""
+        tmp_file = checkpoint_file + ".tmp"
+        try:
+            with open(tmp_file, "wb") as fh:
+                fh.write(orjson.dumps(checkpoint))
+            os.replace(tmp_file, checkpoint_file)
+        except OSError as exc:
+            logger.warning("Could not write audit checkpoint: %s", exc)
+
     @staticmethod
     def _compute_hash(
         previous_hash: str,
@@ -134,13 +230,19 @@ class AuditChainVerifier:
         target_ids: list[str],
         details: dict[str, Any],
     ) -> str:
-        """Recompute the SHA-256 entry hash using the same formula as AuditLogger."""
-        parts = [
-            previous_hash,
-            timestamp_iso,
-            action_value,
-            json.dumps(target_ids, sort_keys=True),
-            json.dumps(details, sort_keys=True, default=str),
-        ]
-        raw = "|".join(parts)
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        """Recompute the SHA-256 entry hash using the same formula as AuditLogger.
+
+        The JSON fragments stay on stdlib ``json.dumps``: its ``", "``
+        separators and ASCII escaping are part of the hashed bytes of every
+        existing log, and orjson's compact output would not reproduce them.
+        """
+        h = hashlib.sha256(previous_hash.encode("utf-8"))
+        h.update(b"|")
+        h.update(timestamp_iso.encode("utf-8"))
+        h.update(b"|")
+        h.update(action_value.encode("utf-8"))
+        h.update(b"|")
+        h.update(json.dumps(target_ids, sort_keys=True).encode("utf-8"))
+        h.update(b"|")
+        h.update(json.dumps(details, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
@@ -4,9 +4,14 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TextIO
+
+import orjson
 
 from regulationcoder.models.audit_entry import AuditAction, AuditEntry
 
@@ -15,6 +20,12 @@ logger = logging.getLogger(__name__)
 # Sentinel for the very first entry in a fresh log
 _GENESIS_HASH = "0" * 64
 
+# Read buffer for streaming entries out of the log
+_READ_BUFFER_SIZE = 1024 * 1024
+
+# Initial number of bytes read from the end of the log to find the last entry
+_TAIL_WINDOW = 64 * 1024
+
 
 class AuditLogger:
     """Append-only audit logger that writes hash-chained JSONL entries.
@@ -25,14 +36,29 @@ class AuditLogger:
 
     This guarantees tamper evidence: modifying or removing any entry breaks
     the chain and can be detected by :class:`AuditChainVerifier`.
+
+    Every entry is written and flushed before :meth:`log` returns. The log
+    file is opened on the first write and kept open for later ones; call
+    :meth:`close` when the logger is no longer needed.
+
+    :meth:`log` is serialized by a lock, so one logger can be shared by
+    threads without forking the hash chain. Use one logger per
+    log file: separate instances each chain from their own last hash.
     """
 
     def __init__(self, log_dir: str) -> None:
         self.log_dir = log_dir
         self._log_file = os.path.join(log_dir, "audit.jsonl")
+        self._fh: TextIO | None = None
+        self._lock = threading.Lock()
         os.makedirs(log_dir, exist_ok=True)
         self._previous_hash = self._read_last_hash()
 
+    @property
+    def log_file(self) -> str:
+        """Path of the JSONL file this logger appends to."""
+        return self._log_file
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -74,6 +100,34 @@ class AuditLogger:
         """
         target_ids = target_ids or []
         details = details or {}
+        with self._lock:
+            entry = self._log_locked(
+                action, stage, target_ids, details, actor,
+                input_hash, output_hash, model_used, verdict,
+            )
+
+        logger.debug(
+            "Audit entry %s: action=%s stage=%s targets=%s",
+            entry.id,
+            action.value,
+            stage,
+            target_ids,
+        )
+        return entry
+
+    def _log_locked(
+        self,
+        action: AuditAction,
+        stage: str,
+        target_ids: list[str],
+        details: dict[str, Any],
+        actor: str,
+        input_hash: str,
+        output_hash: str,
+        model_used: str,
+        verdict: str,
+    ) -> AuditEntry:
+        """Chain, persist and return one entry; the caller holds the lock."""
         now = datetime.now(timezone.utc)
 
         entry_hash = self._compute_hash(
@@ -102,14 +156,6 @@ class AuditLogger:
 
         self._append(entry)
         self._previous_hash = entry_hash
-
-        logger.debug(
-            "Audit entry %s: action=%s stage=%s targets=%s",
-            entry.id,
-            action.value,
-            stage,
-            target_ids,
-        )
         return entry
 
     # ------------------------------------------------------------------
@@ -139,37 +185,81 @@ class AuditLogger:
         target_ids: list[str],
         details: dict[str, Any],
     ) -> str:
-        """Compute the SHA-256 entry hash for chain integrity."""
-        parts = [
-            previous_hash,
-            timestamp_iso,
-            action.value,
-            json.dumps(target_ids, sort_keys=True),
-            json.dumps(details, sort_keys=True, default=str),
-        ]
-        raw = "|".join(parts)
-        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        """Compute the SHA-256 entry hash for chain integrity.
+
+        Fragments are fed to the hasher one at a time with ``b"|"`` between
+        them, which hashes the same bytes as ``"|".join(parts)`` without
+        building the joined string. The JSON fragments must keep stdlib
+        ``json.dumps`` formatting (``", "`` separators, ASCII escaping) so
+        existing logs still verify.
+        """
+        h = hashlib.sha256(previous_hash.encode("utf-8"))
+        h.update(b"|")
+        h.update(timestamp_iso.encode("utf-8"))
+        h.update(b"|")
+        h.update(action.value.encode("utf-8"))
+        h.update(b"|")
+        h.update(json.dumps(target_ids, sort_keys=True).encode("utf-8"))
+        h.update(b"|")
+        h.update(json.dumps(details, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def close(self) -> None:
+        """Close the log file handle; a later :meth:`log` reopens it."""
+        with self._lock:
+            self._close_handle()
+
+    def __del__(self) -> None:
+        # Short-lived loggers (one per pipeline run) are rarely closed
+        # explicitly; release the handle when they are collected.
+        self._close_handle()
+
+    def _close_handle(self) -> None:
+        if self._fh is not None:
+            fh, self._fh = self._fh, None
+            with suppress(OSError):
+                fh.close()
 
     def _append(self, entry: AuditEntry) -> None:
         """Append a single entry to the JSONL log file."""
-        with open(self._log_file, "a", encoding="utf-8") as fh:
-            fh.write(entry.model_dump_json() + "\n")
+        if self._fh is None:
+            self._fh = open(self._log_file, "a", encoding="utf-8")
+        try:
+            self._fh.write(entry.model_dump_json() + "\n")
+            self._fh.flush()
+        except OSError:
+            # Reopen on the next write in case the handle itself went bad
+            self._close_handle()
+            raise
 
     def _read_last_hash(self) -> str:
-        """Read the hash of the last entry in the log file, or return genesis."""
+        """Read the hash of the last entry in the log file, or return genesis.
+
+        Only the tail of the file is read: a window at the end is scanned
+        for the last complete line and doubled until one is found, so the
+        cost does not grow with the length of the log.
+        """
         if not os.path.exists(self._log_file):
             return _GENESIS_HASH
         try:
-            last_line = ""
-            with open(self._log_file, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    stripped = line.strip()
-                    if stripped:
-                        last_line = stripped
+            last_line = b""
+            with open(self._log_file, "rb") as fh:
+                size = fh.seek(0, os.SEEK_END)
+                window = _TAIL_WINDOW
+                while size:
+                    start = max(0, size - window)
+                    fh.seek(start)
+                    lines = fh.read().splitlines()
+                    # The first line of a partial window may be truncated
+                    candidates = lines if start == 0 else lines[1:]
+                    last_line = next((ln for ln in reversed(candidates) if ln.strip()), b"")
+                    if last_line or start == 0:
+                        break
+                    window *= 2
             if last_line:
-                data = json.loads(last_line)
+                data = orjson.loads(last_line)
                 return data.get("entry_hash", _GENESIS_HASH)
-        except (json.JSONDecodeError, OSError) as exc:
+        except (orjson.JSONDecodeError, OSError) as exc:
             logger.warning("Could not read last audit hash: %s", exc)
         return _GENESIS_HASH
 
@@ -190,26 +280,44 @@ class AuditLogger:
         list[AuditEntry]
             All entries in chronological order.
         """
+        return list(self.iter_from_file(path))
+
+    def iter_from_file(self, path: str | None = None) -> Iterator[AuditEntry]:
+        """Yield audit entries from a JSONL log file one line at a time.
+
+        Unlike :meth:`load_from_file` this never holds more than one entry,
+        so it suits very large logs.
+
+        Parameters
+        ----------
+        path:
+            Path to the JSONL file. Defaults to the instance's log file.
+
+        Yields
+        ------
+        AuditEntry
+            Entries in chronological order; malformed lines are skipped.
+        """
         log_file = path or self._log_file
-        entries: list[AuditEntry] = []
         if not os.path.exists(log_file):
-            return entries
-        with open(log_file, encoding="utf-8") as fh:
+            return
+        # Each line goes straight to pydantic-core as bytes
+        with open(log_file, "rb", buffering=_READ_BUFFER_SIZE) as fh:
             for line in fh:
-                line = line.strip()
-                if line:
+                if line.strip():
                     try:
-                        entries.append(AuditEntry.model_validate_json(line))
+                        yield AuditEntry.model_validate_json(line)
                     except Exception as exc:
                         logger.warning("Skipping malformed audit entry: %s", exc)
-        return entries
 
     @classmethod
-    def verify_chain(cls, entries: list[AuditEntry]) -> tuple[bool, list[str]]:
+    def verify_chain(cls, entries: Iterable[AuditEntry]) -> tuple[bool, list[str]]:
         """Verify the hash-chain integrity of a sequence of audit entries.
 
         Recomputes each entry's hash using the same algorithm as ``log()``
         and checks that every ``previous_hash`` links to the preceding entry.
+        Entries are consumed in a single pass, so *entries* may be a lazy
+        iterator such as :meth:`iter_from_file`.
 
         Parameters
         ----------
@@ -222,24 +330,28 @@ class AuditLogger:
             ``(is_valid, error_messages)``
         """
         errors: list[str] = []
-        if not entries:
-            return True, []
-
-        # First entry must reference the genesis hash
-        if entries[0].previous_hash != _GENESIS_HASH:
-            errors.append(
-                f"First entry {entries[0].id} does not reference genesis hash "
-                f"(got '{entries[0].previous_hash}')"
-            )
 
-        for i, entry in enumerate(entries):
+        # Bind hot callables locally and carry the prior hash forward so the
+        # loop makes a single pass without indexing into the entries.
+        compute_hash = cls._compute_hash
+        normalize = cls._normalize_timestamp
+        prior_hash: str | None = None
+
+        for entry in entries:
+            # First entry must reference the genesis hash
+            if prior_hash is None and entry.previous_hash != _GENESIS_HASH:
+                errors.append(
+                    f"First entry {entry.id} does not reference genesis hash "
+                    f"(got '{entry.previous_hash}')"
+                )
+
             # Recompute the entry hash
-            expected_hash = cls._compute_hash(
-                previous_hash=entry.previous_hash,
-                timestamp_iso=cls._normalize_timestamp(entry.timestamp),
-                action=entry.action,
-                target_ids=entry.target_ids,
-                details=entry.details,
+            expected_hash = compute_hash(
+                entry.previous_hash,
+                normalize(entry.timestamp),
+                entry.action,
+                entry.target_ids,
+                entry.details,
             )
             if entry.entry_hash != expected_hash:
                 errors.append(
@@ -248,11 +360,11 @@ class AuditLogger:
                 )
 
             # Check chain linkage (skip the first entry)
-            if i > 0:
-                if entry.previous_hash != entries[i - 1].entry_hash:
-                    errors.append(
-                        f"Entry {entry.id} chain broken: previous_hash={entry.previous_hash} "
-                        f"does not match prior entry hash={entries[i - 1].entry_hash}"
-                    )
+            if prior_hash is not None and entry.previous_hash != prior_hash:
+                errors.append(
+                    f"Entry {entry.id} chain broken: previous_hash={entry.previous_hash} "
+                    f"does not match prior entry hash={prior_hash}"
+                )
+            prior_hash = entry.entry_hash
 
         return len(errors) == 0, errors
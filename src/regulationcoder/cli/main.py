@@ -1,16 +1,34 @@
 """RegulationCoder CLI — Click-based command-line interface."""
 
-import json
 import os
 import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Above this many rows, per-rule and per-gap results are printed as plain
+# tab-separated lines: Rich tables measure every cell to lay out columns,
+# which gets very slow for large regulations.
+_TABLE_ROW_LIMIT = 500
+
+# Rich is imported on first use so `--help` and quick commands skip its
+# import cost; every command shares one Console.
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 @click.group()
@@ -42,11 +60,20 @@ def cli():
     default="json",
     help="Output format",
 )
-def check(profile: str, regulation: str, output: str, fmt: str):
+@click.option(
+    "--no-table",
+    is_flag=True,
+    help="Print per-rule and per-gap results as plain lines instead of tables",
+)
+def check(profile: str, regulation: str, output: str, fmt: str, no_table: bool):
     """Evaluate a system profile against a regulation."""
+    from pydantic import ValidationError
+    from rich.panel import Panel
+
     from regulationcoder.core.engine import ComplianceEngine
     from regulationcoder.models.profile import SystemProfile
 
+    console = _get_console()
     console.print(
         Panel(
             "[bold blue]RegulationCoder[/bold blue] - Compliance Check",
@@ -57,10 +84,9 @@ def check(profile: str, regulation: str, output: str, fmt: str):
     # Load profile JSON
     console.print(f"[dim]Loading profile from:[/dim] {profile}")
     try:
-        with open(profile, encoding="utf-8") as f:
-            profile_data = json.load(f)
-        system_profile = SystemProfile(**profile_data)
-    except (json.JSONDecodeError, ValueError) as e:
+        # Parsed and validated in one step by pydantic-core, with no dict in between
+        system_profile = SystemProfile.model_validate_json(Path(profile).read_bytes())
+    except ValidationError as e:
         console.print(f"[bold red]Error loading profile:[/bold red] {e}")
         sys.exit(1)
 
@@ -80,47 +106,54 @@ def check(profile: str, regulation: str, output: str, fmt: str):
     console.print("[dim]Running evaluation...[/dim]")
     report = engine.evaluate(system_profile)
 
-    # Export results
-    base, ext = os.path.splitext(output)
+    # Export results: a lone JSON export goes to exactly --output; otherwise
+    # the file extension is swapped for the format being written
+    output_path = Path(output)
     if fmt in ("json", "both"):
-        json_path = output if fmt == "json" else f"{base}.json"
-        report.export_json(json_path)
+        json_path = output_path if fmt == "json" else output_path.with_suffix(".json")
+        report.export_json(str(json_path))
         console.print(f"[green]JSON report saved:[/green] {json_path}")
 
     if fmt in ("html", "both"):
-        html_path = f"{base}.html" if fmt == "both" else output.replace(".json", ".html")
-        if html_path == output and not html_path.endswith(".html"):
-            html_path = f"{base}.html"
-        report.export_html(html_path)
+        html_path = output_path.with_suffix(".html")
+        report.export_html(str(html_path))
         console.print(f"[green]HTML report saved:[/green] {html_path}")
 
-    # Print summary table
-    console.print()
-    _print_summary_table(report)
-    _print_gaps_summary(report)
-
-    # Overall verdict
-    verdict_color = {
-        "compliant": "green",
-        "partial_compliance": "yellow",
-        "non_compliant": "red",
-    }.get(report.overall_verdict, "red")
-
-    console.print()
-    console.print(
-        Panel(
-            f"[bold {verdict_color}]{report.overall_verdict.replace('_', ' ').title()}[/bold {verdict_color}]"
-            f"  -  Score: {report.summary.compliance_score}%",
-            title="Overall Verdict",
-            border_style=verdict_color,
+    # Render the summary into one buffer and write it to stdout in one call
+    with console.capture() as capture:
+        console.print()
+        _print_summary_table(report, plain=no_table)
+        _print_gaps_summary(report, plain=no_table)
+
+        # Overall verdict
+        verdict_color = {
+            "compliant": "green",
+            "partial_compliance": "yellow",
+            "non_compliant": "red",
+        }.get(report.overall_verdict, "red")
+
+        console.print()
+        console.print(
+            Panel(
+                f"[bold {verdict_color}]{report.overall_verdict.replace('_', ' ').title()}[/bold {verdict_color}]"
+                f"  -  Score: {report.summary.compliance_score}%",
+                title="Overall Verdict",
+                border_style=verdict_color,
+            )
         )
-    )
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
 
+def _print_summary_table(report, plain: bool = False):
+    """Print the evaluation summary as a Rich table.
 
-def _print_summary_table(report):
-    """Print the evaluation summary as a Rich table."""
-    from regulationcoder.models.evaluation import ComplianceReport
+    Per-rule results fall back to plain lines when *plain* is set or the
+    report has more than ``_TABLE_ROW_LIMIT`` rules.
+    """
+    from rich.table import Table
 
+    console = _get_console()
     table = Table(title="Evaluation Summary", show_header=True, header_style="bold cyan")
     table.add_column("Metric", style="dim", width=20)
     table.add_column("Value", justify="right")
@@ -137,6 +170,16 @@ def _print_summary_table(report):
 
     # Print per-rule results table
     console.print()
+    if plain or len(report.rule_results) > _TABLE_ROW_LIMIT:
+        _print_plain_lines(
+            "Rule Results",
+            (
+                (r.rule_id, r.title, r.verdict.value, r.severity, r.article_ref)
+                for r in report.rule_results
+            ),
+        )
+        return
+
     rule_table = Table(
         title="Rule Results",
         show_header=True,
@@ -145,8 +188,8 @@ def _print_summary_table(report):
     )
     rule_table.add_column("Rule ID", style="dim", no_wrap=True)
     rule_table.add_column("Title", width=40)
-    rule_table.add_column("Verdict", justify="center")
-    rule_table.add_column("Severity", justify="center")
+    rule_table.add_column("Verdict", justify="center", width=8, no_wrap=True)
+    rule_table.add_column("Severity", justify="center", width=8, no_wrap=True)
     rule_table.add_column("Article", style="dim")
 
     verdict_styles = {
@@ -175,21 +218,43 @@ def _print_summary_table(report):
     console.print(rule_table)
 
 
-def _print_gaps_summary(report):
-    """Print a summary of compliance gaps."""
+def _print_gaps_summary(report, plain: bool = False):
+    """Print a summary of compliance gaps.
+
+    Falls back to plain lines when *plain* is set or there are more than
+    ``_TABLE_ROW_LIMIT`` gaps.
+    """
+    from rich.table import Table
+
+    console = _get_console()
     total_gaps = len(report.critical_gaps) + len(report.high_gaps) + len(report.medium_gaps)
     if total_gaps == 0:
         console.print("\n[green]No compliance gaps found.[/green]")
         return
 
     console.print()
+    if plain or total_gaps > _TABLE_ROW_LIMIT:
+        _print_plain_lines(
+            f"Compliance Gaps ({total_gaps} total)",
+            (
+                (label, gap.rule_id, gap.description, gap.article_ref, gap.remediation)
+                for label, gaps in (
+                    ("CRITICAL", report.critical_gaps),
+                    ("HIGH", report.high_gaps),
+                    ("MEDIUM", report.medium_gaps),
+                )
+                for gap in gaps
+            ),
+        )
+        return
+
     gap_table = Table(
         title=f"Compliance Gaps ({total_gaps} total)",
         show_header=True,
         header_style="bold red",
         show_lines=True,
     )
-    gap_table.add_column("Severity", justify="center", width=10)
+    gap_table.add_column("Severity", justify="center", width=10, no_wrap=True)
     gap_table.add_column("Rule", style="dim", no_wrap=True)
     gap_table.add_column("Description", width=40)
     gap_table.add_column("Article")
@@ -223,6 +288,19 @@ def _print_gaps_summary(report):
     console.print(gap_table)
 
 
+def _print_plain_lines(title: str, rows) -> None:
+    """Print *rows* as tab-separated lines under a bold *title*."""
+    console = _get_console()
+    console.print(f"[bold]{title}[/bold]")
+    # One print of pre-joined text, without markup parsing or wrapping
+    console.print(
+        "\n".join("\t".join(map(str, row)) for row in rows),
+        markup=False,
+        highlight=False,
+        soft_wrap=True,
+    )
+
+
 @cli.command()
 @click.option(
     "--file",
@@ -235,8 +313,12 @@ def _print_gaps_summary(report):
 @click.option("--version", required=True, help="Document version identifier")
 def ingest(file_path: str, regulation_id: str, version: str):
     """Ingest a regulation document (PDF/HTML)."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     from regulationcoder.core.pipeline import PipelineOrchestrator
 
+    console = _get_console()
     console.print(
         Panel(
             "[bold blue]RegulationCoder[/bold blue] - Document Ingestion",
@@ -290,6 +372,11 @@ def ingest(file_path: str, regulation_id: str, version: str):
 @click.option("--output", default="diff_report.json", help="Output file path")
 def diff(old_version: str, new_version: str, regulation_id: str, output: str):
     """Compare two regulation versions."""
+    import orjson
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _get_console()
     console.print(
         Panel(
             "[bold blue]RegulationCoder[/bold blue] - Version Diff",
@@ -324,8 +411,9 @@ def diff(old_version: str, new_version: str, regulation_id: str, output: str):
 
     # Export
     os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
-    with open(output, "w", encoding="utf-8") as f:
-        json.dump(diff_result.model_dump(mode="json"), f, indent=2, default=str)
+    payload = orjson.dumps(diff_result.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    with open(output, "wb") as f:
+        f.write(payload)
 
     console.print(f"\n[green]Diff report saved:[/green] {output}")
 
@@ -350,8 +438,13 @@ def diff(old_version: str, new_version: str, regulation_id: str, output: str):
 )
 def verify_audit(log_dir: str):
     """Verify audit log hash chain integrity."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     from regulationcoder.audit.logger import AuditLogger
+    from regulationcoder.models.audit_entry import AuditEntry
 
+    console = _get_console()
     console.print(
         Panel(
             "[bold blue]RegulationCoder[/bold blue] - Audit Verification",
@@ -367,22 +460,35 @@ def verify_audit(log_dir: str):
     console.print(f"[dim]Loading audit log:[/dim] {log_file}")
 
     audit_logger = AuditLogger(log_dir=log_dir)
-    entries = audit_logger.load_from_file(log_file)
-    console.print(f"[dim]Found {len(entries)} entries[/dim]")
 
-    if not entries:
+    # Stream entries through verification, keeping only what the summary needs
+    total = 0
+    first_entry: AuditEntry | None = None
+    last_entry: AuditEntry | None = None
+
+    def tracked(entries: Iterable[AuditEntry]) -> Iterator[AuditEntry]:
+        nonlocal total, first_entry, last_entry
+        for entry in entries:
+            total += 1
+            if first_entry is None:
+                first_entry = entry
+            last_entry = entry
+            yield entry
+
+    is_valid, errors = AuditLogger.verify_chain(tracked(audit_logger.iter_from_file(log_file)))
+    console.print(f"[dim]Found {total} entries[/dim]")
+
+    if first_entry is None or last_entry is None:
         console.print("[yellow]No entries to verify.[/yellow]")
         return
 
-    is_valid, errors = AuditLogger.verify_chain(entries)
-
     # Summary table
     table = Table(title="Audit Verification", show_header=True, header_style="bold cyan")
     table.add_column("Metric", style="dim")
     table.add_column("Value", justify="right")
-    table.add_row("Total Entries", str(len(entries)))
-    table.add_row("First Entry", entries[0].timestamp.isoformat())
-    table.add_row("Last Entry", entries[-1].timestamp.isoformat())
+    table.add_row("Total Entries", str(total))
+    table.add_row("First Entry", first_entry.timestamp.isoformat())
+    table.add_row("Last Entry", last_entry.timestamp.isoformat())
     table.add_row(
         "Chain Integrity",
         "[bold green]VALID[/bold green]" if is_valid else "[bold red]BROKEN[/bold red]",
@@ -1,13 +1,24 @@
 """MappingGenerator — creates article-to-rule traceability mappings."""
 
 import logging
+import math
+import re
 from collections import defaultdict
+from functools import lru_cache
 
-from regulationcoder.models.requirement import Requirement
-from regulationcoder.models.rule import Rule
+from regulationcoder.models.requirement import Modality, Requirement
+from regulationcoder.models.rule import Rule, RuleType, Severity
 
 logger = logging.getLogger(__name__)
 
+_ARTICLE_NUMBER_RE = re.compile(r"\d+")
+
+# Enum member -> value, resolved once: a dict lookup is much cheaper than
+# the ``.value`` descriptor in the per-rule loop
+_RULE_TYPE_VALUES = {member: member.value for member in RuleType}
+_SEVERITY_VALUES = {member: member.value for member in Severity}
+_MODALITY_VALUES = {member: member.value for member in Modality}
+
 
 class MappingGenerator:
     """Generate traceability mapping from articles to rules and requirements.
@@ -62,23 +73,25 @@ class MappingGenerator:
                 "requirement_to_clause": { "REQ-...": "clause-id" },
             }
         """
-        # Index requirements by ID
-        req_by_id: dict[str, Requirement] = {r.id: r for r in requirements}
-
-        # Index rules by requirement ID
+        # Index rules by requirement ID and build the rule reverse mapping
         rules_by_req: dict[str, list[Rule]] = defaultdict(list)
+        rule_to_requirement: dict[str, str] = {}
         for rule in rules:
             rules_by_req[rule.requirement_id].append(rule)
+            rule_to_requirement[rule.id] = rule.requirement_id
 
-        # Group requirements by article reference
+        # Group requirements by article reference and build the clause mapping
         article_groups: dict[str, list[Requirement]] = defaultdict(list)
+        requirement_to_clause: dict[str, str] = {}
         for req in requirements:
-            article_ref = self._extract_article_ref(req)
-            article_groups[article_ref].append(req)
+            article_groups[self._extract_article_ref(req)].append(req)
+            requirement_to_clause[req.id] = req.clause_id
 
         # Build the mapping structure
         articles_map: dict[str, dict] = {}
-        for article_ref in sorted(article_groups.keys()):
+        rule_type_values = _RULE_TYPE_VALUES
+        severity_values = _SEVERITY_VALUES
+        for article_ref in sorted(article_groups, key=_article_sort_key):
             reqs = article_groups[article_ref]
             req_entries = []
             for req in reqs:
@@ -86,8 +99,8 @@ class MappingGenerator:
                 rule_entries = [
                     {
                         "rule_id": rule.id,
-                        "rule_type": rule.rule_type.value,
-                        "severity": rule.severity.value,
+                        "rule_type": rule_type_values[rule.rule_type],
+                        "severity": severity_values[rule.severity],
                         "title": rule.title,
                     }
                     for rule in associated_rules
@@ -95,7 +108,7 @@ class MappingGenerator:
                 req_entries.append(
                     {
                         "requirement_id": req.id,
-                        "modality": req.modality.value,
+                        "modality": _MODALITY_VALUES[req.modality],
                         "subject": req.subject,
                         "action": req.action,
                         "object": req.object,
@@ -108,10 +121,6 @@ class MappingGenerator:
                 "requirements": req_entries,
             }
 
-        # Build reverse mappings
-        rule_to_requirement = {rule.id: rule.requirement_id for rule in rules}
-        requirement_to_clause = {req.id: req.clause_id for req in requirements}
-
         mapping = {
             "metadata": {
                 "total_articles": len(articles_map),
@@ -145,13 +154,30 @@ class MappingGenerator:
                 return ref
 
         # Fall back to parsing the requirement ID
-        # Format: REQ-EU-AI-ACT-{art:03d}-{para:02d}{sub}-{seq:03d}
-        parts = requirement.id.split("-")
-        if len(parts) >= 5:
-            try:
-                art_num = int(parts[4])
-                return f"Article {art_num}"
-            except ValueError:
-                pass
-
-        return "Unknown Article"
+        return _article_ref_from_requirement_id(requirement.id)
+
+
+def _article_sort_key(article_ref: str) -> tuple[float, str]:
+    """Order article refs by article number ("Article 2" before "Article 10").
+
+    Refs without a number (e.g. ``"Unknown Article"``) sort last.
+    """
+    match = _ARTICLE_NUMBER_RE.search(article_ref)
+    return (int(match.group()) if match else math.inf, article_ref)
+
+
+@lru_cache(maxsize=4096)
+def _article_ref_from_requirement_id(requirement_id: str) -> str:
+    """Derive ``"Article N"`` from a requirement ID, memoized across calls.
+
+    Format: REQ-EU-AI-ACT-{art:03d}-{para:02d}{sub}-{seq:03d}
+    """
+    parts = requirement_id.split("-")
+    if len(parts) >= 5:
+        try:
+            art_num = int(parts[4])
+            return f"Article {art_num}"
+        except ValueError:
+            pass
+
+    return "Unknown Article"
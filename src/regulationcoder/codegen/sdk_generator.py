@@ -1,17 +1,30 @@
 """SDKGenerator — uses Anthropic Claude to generate Python evaluation functions from rules."""
 
+import asyncio
 import json
 import logging
-import re
-
-import anthropic
+import textwrap
+from typing import TYPE_CHECKING
 
 from regulationcoder.core.config import Settings
+from regulationcoder.core.disk_cache import DiskCache
 from regulationcoder.core.exceptions import CodeGenerationError
+from regulationcoder.core.fences import strip_fences
 from regulationcoder.models.rule import Rule
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger(__name__)
 
+# Default number of in-flight requests for generate_many
+_DEFAULT_CONCURRENCY = 8
+
+# Rule ID -> function suffix: hyphens to underscores, ASCII upper to lower
+_SNAKE_TABLE = str.maketrans(
+    "-ABCDEFGHIJKLMNOPQRSTUVWXYZ", "_abcdefghijklmnopqrstuvwxyz"
+)
+
 _CODEGEN_SYSTEM_PROMPT = """\
 You are a senior Python engineer generating compliance evaluation functions from \
 formalized regulatory rules.
@@ -65,22 +78,46 @@ implements this rule's evaluation logic. The function must:
 Return ONLY the Python function code."""
 
 
+# Fallback wrapper used when the generated code lacks the expected function
+_WRAP_TEMPLATE = """\
+def evaluate_{function_name}(profile: dict) -> str:
+    \"\"\"Evaluate compliance for {title}.
+
+    Source: {article_ref}
+    Rule: {rule_id}
+    Severity: {severity}
+
+    Returns: 'pass', 'fail', or 'not_applicable'
+    \"\"\"
+{body}
+"""
+
+
 class SDKGenerator:
     """Generate Python evaluation functions from compliance rules using Claude Sonnet.
 
     Usage:
         generator = SDKGenerator(settings)
         code = generator.generate(rule)
+        codes = generator.generate_many(rules)
     """
 
     def __init__(self, settings: Settings) -> None:
+        # Imported here so MappingGenerator/TestGenerator users, which share
+        # this package, do not pay for importing the Anthropic SDK.
+        import anthropic
+
         self.settings = settings
         self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
         self.model = settings.extraction_model
+        self.cache = DiskCache(settings.codegen_cache_dir, suffix=".py", name="codegen")
 
     def generate(self, rule: Rule) -> str:
         """Generate a Python evaluation function for a Rule.
 
+        Results are cached on disk under ``settings.codegen_cache_dir``, keyed
+        by the model and prompts, so unchanged rules skip the API call.
+
         Args:
             rule: A Rule object to generate code for.
 
@@ -90,6 +127,99 @@ class SDKGenerator:
         Raises:
             CodeGenerationError: If the API call or code parsing fails.
         """
+        import anthropic
+
+        function_name, article_ref, user_prompt = self._build_prompt(rule)
+        cache_key = DiskCache.key(self.model, _CODEGEN_SYSTEM_PROMPT, user_prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached SDK code for rule %s", rule.id)
+            return cached
+
+        logger.info("Generating SDK code for rule %s", rule.id)
+
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=4096,
+                system=_CODEGEN_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": user_prompt}],
+            )
+        except anthropic.APIError as e:
+            raise CodeGenerationError(
+                f"Anthropic API error during code generation for {rule.id}: {e}"
+            ) from e
+
+        code = self._finalize(response.content[0].text, rule, function_name, article_ref)
+        self.cache.put(cache_key, code)
+        return code
+
+    def generate_many(
+        self, rules: list[Rule], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[str]:
+        """Generate evaluation functions for many rules concurrently.
+
+        Requests go through one :class:`anthropic.AsyncAnthropic` client, with
+        at most *concurrency* in flight at once. Cached rules are served from
+        disk without a request. Must not be called from a running event loop.
+
+        Args:
+            rules: The rules to generate code for.
+            concurrency: Maximum number of concurrent API requests.
+
+        Returns:
+            The generated source code for each rule, in the order of *rules*.
+
+        Raises:
+            CodeGenerationError: If any API call or code parsing fails.
+        """
+        return asyncio.run(self._generate_all(rules, max(1, concurrency)))
+
+    async def _generate_all(self, rules: list[Rule], concurrency: int) -> list[str]:
+        """Fan out one task per rule over a single shared async client."""
+        import anthropic
+
+        sem = asyncio.Semaphore(concurrency)
+        async with anthropic.AsyncAnthropic(api_key=self.settings.anthropic_api_key) as aclient:
+            return list(
+                await asyncio.gather(
+                    *(self._generate_one(aclient, sem, rule) for rule in rules)
+                )
+            )
+
+    async def _generate_one(
+        self, aclient: "anthropic.AsyncAnthropic", sem: asyncio.Semaphore, rule: Rule
+    ) -> str:
+        """Async counterpart of :meth:`generate`, gated by *sem*."""
+        import anthropic
+
+        function_name, article_ref, user_prompt = self._build_prompt(rule)
+        cache_key = DiskCache.key(self.model, _CODEGEN_SYSTEM_PROMPT, user_prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached SDK code for rule %s", rule.id)
+            return cached
+
+        async with sem:
+            logger.info("Generating SDK code for rule %s", rule.id)
+            try:
+                response = await aclient.messages.create(
+                    model=self.model,
+                    max_tokens=4096,
+                    system=_CODEGEN_SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
+            except anthropic.APIError as e:
+                raise CodeGenerationError(
+                    f"Anthropic API error during code generation for {rule.id}: {e}"
+                ) from e
+
+        code = self._finalize(response.content[0].text, rule, function_name, article_ref)
+        self.cache.put(cache_key, code)
+        return code
+
+    def _build_prompt(self, rule: Rule) -> tuple[str, str, str]:
+        """Return ``(function_name, article_ref, user_prompt)`` for a rule."""
         function_name = self._rule_id_to_snake(rule.id)
 
         article_ref = ""
@@ -113,22 +243,12 @@ class SDKGenerator:
             remediation=rule.remediation,
             function_name=function_name,
         )
+        return function_name, article_ref, user_prompt
 
-        logger.info("Generating SDK code for rule %s", rule.id)
-
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=_CODEGEN_SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
-        except anthropic.APIError as e:
-            raise CodeGenerationError(
-                f"Anthropic API error during code generation for {rule.id}: {e}"
-            ) from e
-
-        raw_text = response.content[0].text
+    def _finalize(
+        self, raw_text: str, rule: Rule, function_name: str, article_ref: str
+    ) -> str:
+        """Turn Claude's raw response into the final evaluation function source."""
         code = self._extract_python_code(raw_text, rule.id)
 
         # Validate that the code defines the expected function
@@ -147,20 +267,7 @@ class SDKGenerator:
 
     def _extract_python_code(self, text: str, rule_id: str) -> str:
         """Extract Python code from Claude's response, stripping any markdown fences."""
-        cleaned = text.strip()
-
-        # Strip markdown code fences if present
-        if "```python" in cleaned:
-            parts = cleaned.split("```python", 1)
-            if len(parts) > 1:
-                cleaned = parts[1].split("```", 1)[0]
-        elif "```" in cleaned:
-            parts = cleaned.split("```", 1)
-            if len(parts) > 1:
-                cleaned = parts[1].split("```", 1)[0]
-
-        cleaned = cleaned.strip()
-
+        cleaned = strip_fences(text, "python")
         if not cleaned:
             raise CodeGenerationError(
                 f"Empty code generated for rule {rule_id}"
@@ -174,36 +281,20 @@ class SDKGenerator:
 
         Result: 'eu_ai_act_010_02f_001'
         """
-        # Remove the RULE- prefix
-        suffix = rule_id
-        if suffix.upper().startswith("RULE-"):
-            suffix = suffix[5:]
-        # Replace hyphens with underscores and lowercase
-        return suffix.replace("-", "_").lower()
+        # Remove the RULE- prefix, then hyphens -> underscores and lowercase
+        suffix = rule_id[5:] if rule_id[:5].upper() == "RULE-" else rule_id
+        return suffix.translate(_SNAKE_TABLE)
 
     @staticmethod
     def _wrap_code(
         code: str, rule: Rule, function_name: str, article_ref: str
     ) -> str:
         """Wrap generated code in the expected function signature as a fallback."""
-        indent = "    "
-        docstring_lines = [
-            f'{indent}"""Evaluate compliance for {rule.title}.',
-            f"{indent}",
-            f"{indent}Source: {article_ref}",
-            f"{indent}Rule: {rule.id}",
-            f"{indent}Severity: {rule.severity.value}",
-            f"{indent}",
-            f"{indent}Returns: 'pass', 'fail', or 'not_applicable'",
-            f'{indent}"""',
-        ]
-        docstring = "\n".join(docstring_lines)
-
-        # Indent the original code
-        indented_body = "\n".join(f"{indent}{line}" for line in code.splitlines())
-
-        return (
-            f"def evaluate_{function_name}(profile: dict) -> str:\n"
-            f"{docstring}\n"
-            f"{indented_body}\n"
+        return _WRAP_TEMPLATE.format(
+            function_name=function_name,
+            title=rule.title,
+            article_ref=article_ref,
+            rule_id=rule.id,
+            severity=rule.severity.value,
+            body=textwrap.indent(code, "    "),
         )
@@ -1,13 +1,24 @@
 """TestGenerator — generates pytest test functions from rule test cases."""
 
 import logging
+import os
 import re
 import textwrap
+from collections.abc import Iterator
+from functools import lru_cache
 
 from regulationcoder.models.rule import Rule
 
 logger = logging.getLogger(__name__)
 
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+
+# Same mapping as _NON_ALNUM_RE for code points below 256, applied with a
+# single str.translate; IDs containing anything above fall back to the regex
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in range(256) if not (chr(c).isascii() and chr(c).isalnum())}
+)
+
 
 class TestGenerator:
     """Generate pytest test code from Rule test cases.
@@ -18,6 +29,7 @@ class TestGenerator:
     Usage:
         generator = TestGenerator()
         test_code = generator.generate(rule)
+        generator.generate_to(rule, "tests/test_rule.py")
     """
 
     def generate(self, rule: Rule) -> str:
@@ -29,71 +41,76 @@ class TestGenerator:
         Returns:
             A string containing valid pytest Python source code.
         """
+        return "".join(self._iter_chunks(rule))
+
+    def generate_to(self, rule: Rule, path: str) -> None:
+        """Write pytest source code for a Rule's test cases to *path*.
+
+        The module is written chunk by chunk (one chunk per test function)
+        and never held in memory as a whole. Parent directories are created
+        if needed.
+
+        Args:
+            rule: A Rule object whose test_cases will be converted to pytest functions.
+            path: Destination file path.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.writelines(self._iter_chunks(rule))
+
+    def _iter_chunks(self, rule: Rule) -> Iterator[str]:
+        """Yield the generated test module for *rule* in consecutive pieces."""
         function_name = self._rule_id_to_snake(rule.id)
         module_name = f"evaluate_{function_name}"
 
-        lines: list[str] = []
+        # Module docstring and the evaluation function reference comment
+        yield f'''"""Auto-generated tests for rule {rule.id}."""
+
+import pytest
 
-        # Module docstring
-        lines.append(f'"""Auto-generated tests for rule {rule.id}."""')
-        lines.append("")
-        lines.append("import pytest")
-        lines.append("")
-        lines.append("")
 
-        # Generate the inline evaluation function reference comment
-        lines.append(f"# Tests for: {rule.id}")
-        lines.append(f"# Title: {rule.title}")
-        lines.append(f"# Requirement: {rule.requirement_id}")
-        lines.append("")
+# Tests for: {rule.id}
+# Title: {rule.title}
+# Requirement: {rule.requirement_id}
+
+'''
 
         if not rule.test_cases:
             # Generate a placeholder test
-            lines.append("")
-            lines.append(f"def test_{function_name}_placeholder():")
-            lines.append(f'    """Placeholder test — no test cases defined for {rule.id}."""')
-            lines.append(f"    pytest.skip('No test cases defined for {rule.id}')")
-            lines.append("")
-            code = "\n".join(lines)
+            yield f'''
+def test_{function_name}_placeholder():
+    """Placeholder test — no test cases defined for {rule.id}."""
+    pytest.skip('No test cases defined for {rule.id}')
+'''
             logger.info("Generated placeholder test for rule %s (no test cases)", rule.id)
-            return code
+            return
 
-        # Generate a test function for each test case
-        for tc in rule.test_cases:
+        # Generate a test function for each test case, one block per case
+        for i, tc in enumerate(rule.test_cases):
+            if i:
+                # Two blank lines between test functions
+                yield "\n"
             test_func_name = self._sanitize_test_name(tc.id, function_name)
+            desc = tc.description.replace('"', '\\"')
             expected = tc.expected_result
+            yield f'''
+def {test_func_name}():
+    """{desc}"""
+    profile = {tc.input_data!r}
 
-            lines.append("")
-            lines.append(f"def {test_func_name}():")
+    from regulationcoder.rules.generated import {module_name}
+    result = {module_name}(profile)
+
+    assert result == "{expected}", (
+        f"Expected \\"{expected}\\" but got \\"{{result}}\\" for {rule.id}"
+    )
+'''
 
-            # Docstring
-            desc = tc.description.replace('"', '\\"')
-            lines.append(f'    """{desc}"""')
-
-            # Input data
-            input_repr = repr(tc.input_data)
-            lines.append(f"    profile = {input_repr}")
-            lines.append("")
-
-            # Call the evaluation function
-            lines.append(f"    from regulationcoder.rules.generated import {module_name}")
-            lines.append(f"    result = {module_name}(profile)")
-            lines.append("")
-
-            # Assertion
-            lines.append(f'    assert result == "{expected}", (')
-            lines.append(f'        f"Expected \\"{expected}\\" but got \\"{{result}}\\" '
-                         f'for {rule.id}"')
-            lines.append("    )")
-            lines.append("")
-
-        code = "\n".join(lines)
         logger.info(
             "Generated %d test functions for rule %s",
             len(rule.test_cases),
             rule.id,
         )
-        return code
 
     @staticmethod
     def _rule_id_to_snake(rule_id: str) -> str:
@@ -101,10 +118,7 @@ class TestGenerator:
 
         Example: 'RULE-EU-AI-ACT-010-02F-001' -> 'eu_ai_act_010_02f_001'
         """
-        suffix = rule_id
-        if suffix.upper().startswith("RULE-"):
-            suffix = suffix[5:]
-        return suffix.replace("-", "_").lower()
+        return _rule_id_to_snake(rule_id)
 
     @staticmethod
     def _sanitize_test_name(test_case_id: str, function_name: str) -> str:
@@ -112,9 +126,27 @@ class TestGenerator:
 
         Example: 'TC-EU-AI-ACT-010-02F-001-001' -> 'test_eu_ai_act_010_02f_001_001'
         """
-        # Replace non-alphanumeric characters with underscores
-        sanitized = re.sub(r"[^a-zA-Z0-9]", "_", test_case_id).lower()
-        # Ensure it starts with test_
-        if not sanitized.startswith("test_"):
-            sanitized = f"test_{sanitized}"
-        return sanitized
+        return _sanitize_test_name(test_case_id)
+
+
+# Memoized module-level helpers behind the staticmethods above; the same
+# rules and test cases are regenerated across pipeline runs.
+
+
+@lru_cache(maxsize=4096)
+def _rule_id_to_snake(rule_id: str) -> str:
+    suffix = rule_id[5:] if rule_id[:5].upper() == "RULE-" else rule_id
+    return suffix.replace("-", "_").lower()
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_test_name(test_case_id: str) -> str:
+    # Replace non-alphanumeric characters with underscores
+    sanitized = test_case_id.translate(_SANITIZE_TABLE)
+    if not sanitized.isascii():
+        sanitized = _NON_ALNUM_RE.sub("_", test_case_id)
+    sanitized = sanitized.lower()
+    # Ensure it starts with test_
+    if not sanitized.startswith("test_"):
+        sanitized = f"test_{sanitized}"
+    return sanitized
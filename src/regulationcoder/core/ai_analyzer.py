@@ -5,22 +5,46 @@ Claude Opus 4.6 for holistic, context-aware compliance analysis that goes
 beyond what rule-based evaluation can capture.
 """
 
+import asyncio
 import json
 import logging
+import random
+import re
+import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
-import httpx
-import anthropic
+import orjson
 
 from regulationcoder.core.config import Settings
+from regulationcoder.core.fences import strip_fences
 from regulationcoder.models.ai_analysis import AIAnalysisResult, AIInsight
-from regulationcoder.models.evaluation import ComplianceReport
+from regulationcoder.models.evaluation import ComplianceReport, RuleVerdict
 from regulationcoder.models.profile import SystemProfile
 
+if TYPE_CHECKING:
+    import anthropic
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent HTTP connections held by the async client
+_MAX_CONNECTIONS = 100
+
+# Exponential backoff between API retries: base * 2**(attempt - 1) seconds,
+# capped, then scaled by a random jitter factor in [0.5, 1.5)
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 30.0
+
+# JSON string literals (group 1 is the closing quote, None if truncated) and
+# brackets, for _repair_truncated_json
+_JSON_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(")?|[{}\[\]]', re.DOTALL)
+
 # ── System Prompt ───────────────────────────────────────────────────────
 
+# Sent as a plain string, not a cache_control block: at roughly 1k tokens it
+# is shorter than the judge model's minimum cacheable prefix, so a cache
+# breakpoint here would never produce a cache hit.
 ANALYZER_SYSTEM_PROMPT = """\
 You are a senior EU AI Act compliance analyst powered by Claude Opus 4.6,
 working within the RegulationCoder platform. Your role is to provide deep,
@@ -159,30 +183,26 @@ def _format_gaps(gaps: list) -> str:
     """Format compliance gaps into readable text for the prompt."""
     if not gaps:
         return "  None identified."
-    lines = []
-    for gap in gaps:
-        lines.append(
-            f"  - **[{gap.severity.upper()}]** {gap.description}\n"
-            f"    Rule: {gap.rule_id} | Article: {gap.article_ref}\n"
-            f"    Remediation: {gap.remediation}"
-        )
-    return "\n".join(lines)
+    return "\n".join([
+        f"  - **[{gap.severity.upper()}]** {gap.description}\n"
+        f"    Rule: {gap.rule_id} | Article: {gap.article_ref}\n"
+        f"    Remediation: {gap.remediation}"
+        for gap in gaps
+    ])
 
 
 def _format_failed_rules(rule_results: list) -> str:
     """Format failed rule results into readable text for the prompt."""
-    failed = [r for r in rule_results if r.verdict.value == "fail"]
-    if not failed:
-        return "  No failed rules."
-    lines = []
-    for r in failed:
-        lines.append(
-            f"  - **{r.title}** ({r.rule_id})\n"
-            f"    Severity: {r.severity} | Article: {r.article_ref}\n"
-            f"    Details: {r.details}\n"
-            f"    Remediation: {r.remediation}"
-        )
-    return "\n".join(lines)
+    # Filter and format in one pass over the results
+    lines = [
+        f"  - **{r.title}** ({r.rule_id})\n"
+        f"    Severity: {r.severity} | Article: {r.article_ref}\n"
+        f"    Details: {r.details}\n"
+        f"    Remediation: {r.remediation}"
+        for r in rule_results
+        if r.verdict == RuleVerdict.FAIL
+    ]
+    return "\n".join(lines) if lines else "  No failed rules."
 
 
 class ComplianceAnalyzer:
@@ -193,12 +213,39 @@ class ComplianceAnalyzer:
     """
 
     def __init__(self, settings: Settings) -> None:
+        import anthropic
+        import httpx
+
         self.settings = settings
         self.client = anthropic.Anthropic(
             api_key=settings.anthropic_api_key,
             timeout=httpx.Timeout(300.0, connect=30.0),
         )
         self.model = settings.judge_model
+        self._async_client: "anthropic.AsyncAnthropic | None" = None
+
+    @property
+    def async_client(self) -> "anthropic.AsyncAnthropic":
+        """Async Anthropic client, created on first use.
+
+        The connection pool is sized for many concurrent analyses sharing
+        one client.
+        """
+        if self._async_client is None:
+            import anthropic
+            import httpx
+
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self.settings.anthropic_api_key,
+                timeout=httpx.Timeout(300.0, connect=30.0),
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=_MAX_CONNECTIONS,
+                        max_keepalive_connections=_MAX_CONNECTIONS,
+                    ),
+                ),
+            )
+        return self._async_client
 
     def _build_user_prompt(
         self, profile: SystemProfile, report: ComplianceReport
@@ -232,66 +279,177 @@ class ComplianceAnalyzer:
 
         Closes any open strings, arrays, and objects so json.loads can parse it.
         """
-        # Strip markdown fences first
-        cleaned = text.strip()
-        if "```json" in cleaned:
-            cleaned = cleaned.split("```json")[1]
-            if "```" in cleaned:
-                cleaned = cleaned.split("```")[0]
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-            if "```" in cleaned:
-                cleaned = cleaned.split("```")[0]
-        cleaned = cleaned.strip()
-
-        # Try to find the last successfully parseable position
-        # by progressively adding closing characters
+        cleaned = strip_fences(text, "json")
+
+        # Walk only the structural tokens: whole string literals (matched by
+        # the regex engine in one step each) and brackets. Open brackets are
+        # kept on a stack so they are closed in the reverse order they were
+        # opened.
+        closers: list[str] = []
         in_string = False
-        escape_next = False
-        depth_obj = 0
-        depth_arr = 0
-        last_good = 0
-
-        for i, ch in enumerate(cleaned):
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == "\\":
-                escape_next = True
-                continue
-            if ch == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if ch == "{":
-                depth_obj += 1
-            elif ch == "}":
-                depth_obj -= 1
-            elif ch == "[":
-                depth_arr += 1
-            elif ch == "]":
-                depth_arr -= 1
-            if depth_obj >= 0 and depth_arr >= 0:
-                last_good = i
+        end = len(cleaned)
+        for match in _JSON_TOKEN_RE.finditer(cleaned):
+            token = match.group()
+            if token[0] == '"':
+                if match.group(1) is None:
+                    # Unterminated string: the truncation point. Stop before
+                    # a dangling backslash so the added quote is not escaped.
+                    in_string = True
+                    end = match.end()
+                    break
+            elif token == "{":
+                closers.append("}")
+            elif token == "[":
+                closers.append("]")
+            elif closers:
+                closers.pop()
+            else:
+                # Unbalanced closer: keep only what precedes it
+                end = match.start()
+                break
 
         # Build repair suffix
-        repaired = cleaned[: last_good + 1]
+        repaired = cleaned[:end]
         if in_string:
             repaired += '"'
-        repaired += "]" * max(0, depth_arr)
-        repaired += "}" * max(0, depth_obj)
-
-        return repaired
+        else:
+            repaired = repaired.rstrip().removesuffix(",")
+        return repaired + "".join(reversed(closers))
 
     def _parse_response(self, text: str) -> dict:
         """Parse JSON from the model response, stripping markdown fences if present."""
-        cleaned = text.strip()
-        if "```json" in cleaned:
-            cleaned = cleaned.split("```json")[1].split("```")[0]
-        elif "```" in cleaned:
-            cleaned = cleaned.split("```")[1].split("```")[0]
-        return json.loads(cleaned.strip())
+        cleaned = strip_fences(text, "json")
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+        # handlers still apply
+        return orjson.loads(cleaned)
+
+    def _start_analysis(
+        self, profile: SystemProfile, report: ComplianceReport
+    ) -> tuple[str, datetime, dict]:
+        """Return the analysis ID, timestamp, and Messages API arguments."""
+        # One clock read for both the ID and the timestamp; the nanosecond
+        # suffix keeps IDs distinct for analyses started within one second
+        ns = time.time_ns()
+        now = datetime.fromtimestamp(ns / 1e9, tz=timezone.utc)
+        analysis_id = f"AI-ANALYSIS-{report.id}-{ns}"
+
+        user_prompt = self._build_user_prompt(profile, report)
+
+        logger.info(
+            "Starting AI analysis for system '%s' (report %s) using model %s",
+            profile.system_name,
+            report.id,
+            self.model,
+        )
+
+        request = {
+            "model": self.model,
+            "max_tokens": 8192,
+            "system": ANALYZER_SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+        return analysis_id, now, request
+
+    def _build_result(
+        self,
+        response: "anthropic.types.Message",
+        profile: SystemProfile,
+        report: ComplianceReport,
+        analysis_id: str,
+        now: datetime,
+        attempt: int,
+        max_attempts: int,
+    ) -> AIAnalysisResult:
+        """Parse a model response into an AIAnalysisResult.
+
+        Raises:
+            json.JSONDecodeError: If the response text is not valid JSON.
+        """
+        raw_text = response.content[0].text
+        stop_reason = response.stop_reason
+        logger.debug(
+            "AI analysis response received (%d chars, stop=%s, attempt %d/%d)",
+            len(raw_text),
+            stop_reason,
+            attempt,
+            max_attempts,
+        )
+
+        # If truncated, try to repair the JSON
+        if stop_reason == "max_tokens":
+            raw_text = self._repair_truncated_json(raw_text)
+
+        raw = self._parse_response(raw_text)
+
+        # Build insights from the parsed response
+        insights = []
+        for item in raw.get("insights", []):
+            insights.append(
+                AIInsight(
+                    category=item.get("category", "general_compliance"),
+                    title=item.get("title", ""),
+                    analysis=item.get("analysis", ""),
+                    severity=item.get("severity", "medium"),
+                    recommendations=item.get("recommendations", []),
+                    relevant_articles=item.get("relevant_articles", []),
+                )
+            )
+
+        result = AIAnalysisResult(
+            id=analysis_id,
+            report_id=report.id,
+            model_used=self.model,
+            executive_summary=raw.get("executive_summary", ""),
+            overall_risk_level=raw.get("overall_risk_level", "medium"),
+            risk_narrative=raw.get("risk_narrative", ""),
+            key_strengths=raw.get("key_strengths", []),
+            insights=insights,
+            prioritized_actions=raw.get("prioritized_actions", []),
+            regulatory_context=raw.get("regulatory_context", ""),
+            timestamp=now,
+        )
+
+        logger.info(
+            "AI analysis complete for '%s': risk_level=%s, insights=%d, actions=%d",
+            profile.system_name,
+            result.overall_risk_level,
+            len(result.insights),
+            len(result.prioritized_actions),
+        )
+        return result
+
+    @staticmethod
+    def _log_attempt_failure(exc: Exception, attempt: int, max_attempts: int) -> None:
+        """Log a failed analysis attempt that will be retried."""
+        if isinstance(exc, json.JSONDecodeError):
+            message = "Failed to parse AI analysis JSON (attempt %d/%d): %s"
+        else:
+            message = "Anthropic API error during AI analysis (attempt %d/%d): %s"
+        logger.warning(message, attempt, max_attempts, exc)
+
+    @staticmethod
+    def _retry_delay(exc: Exception, attempt: int) -> float:
+        """Seconds to wait before retrying after *exc* on *attempt*.
+
+        Malformed JSON is retried immediately. API errors back off
+        exponentially with jitter so concurrent callers do not retry in
+        lockstep, and a ``retry-after`` header from the server takes
+        precedence when present.
+        """
+        import anthropic
+
+        if not isinstance(exc, anthropic.APIError):
+            return 0.0
+        response = getattr(exc, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return min(_BACKOFF_CAP, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass
+        delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.5)
 
     def analyze(
         self, profile: SystemProfile, report: ComplianceReport
@@ -309,110 +467,90 @@ class ComplianceAnalyzer:
             RuntimeError: If the API call fails after retries or the response
                 cannot be parsed into a valid AIAnalysisResult.
         """
-        now = datetime.now(timezone.utc)
-        analysis_id = (
-            f"AI-ANALYSIS-{report.id}-{now.strftime('%Y%m%dT%H%M%S')}"
-        )
-
-        user_prompt = self._build_user_prompt(profile, report)
+        import anthropic
 
-        logger.info(
-            "Starting AI analysis for system '%s' (report %s) using model %s",
-            profile.system_name,
-            report.id,
-            self.model,
-        )
+        analysis_id, now, request = self._start_analysis(profile, report)
 
         last_error: Exception | None = None
         max_attempts = self.settings.max_judge_retries + 1
 
         for attempt in range(1, max_attempts + 1):
             try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=8192,
-                    system=ANALYZER_SYSTEM_PROMPT,
-                    messages=[{"role": "user", "content": user_prompt}],
-                )
-                raw_text = response.content[0].text
-                stop_reason = response.stop_reason
-                logger.debug(
-                    "AI analysis response received (%d chars, stop=%s, attempt %d/%d)",
-                    len(raw_text),
-                    stop_reason,
-                    attempt,
-                    max_attempts,
+                response = self.client.messages.create(**request)
+                return self._build_result(
+                    response, profile, report, analysis_id, now, attempt, max_attempts
                 )
+            except (json.JSONDecodeError, anthropic.APIError) as exc:
+                last_error = exc
+                self._log_attempt_failure(exc, attempt, max_attempts)
+                if attempt < max_attempts:
+                    time.sleep(self._retry_delay(exc, attempt))
 
-                # If truncated, try to repair the JSON
-                if stop_reason == "max_tokens":
-                    raw_text = self._repair_truncated_json(raw_text)
-
-                raw = self._parse_response(raw_text)
-
-                # Build insights from the parsed response
-                insights = []
-                for item in raw.get("insights", []):
-                    insights.append(
-                        AIInsight(
-                            category=item.get("category", "general_compliance"),
-                            title=item.get("title", ""),
-                            analysis=item.get("analysis", ""),
-                            severity=item.get("severity", "medium"),
-                            recommendations=item.get("recommendations", []),
-                            relevant_articles=item.get("relevant_articles", []),
-                        )
-                    )
-
-                result = AIAnalysisResult(
-                    id=analysis_id,
-                    report_id=report.id,
-                    model_used=self.model,
-                    executive_summary=raw.get("executive_summary", ""),
-                    overall_risk_level=raw.get("overall_risk_level", "medium"),
-                    risk_narrative=raw.get("risk_narrative", ""),
-                    key_strengths=raw.get("key_strengths", []),
-                    insights=insights,
-                    prioritized_actions=raw.get("prioritized_actions", []),
-                    regulatory_context=raw.get("regulatory_context", ""),
-                    timestamp=now,
-                )
+        raise RuntimeError(
+            f"AI analysis failed after {max_attempts} attempts for report "
+            f"{report.id}: {last_error}"
+        ) from last_error
 
-                logger.info(
-                    "AI analysis complete for '%s': risk_level=%s, insights=%d, actions=%d",
-                    profile.system_name,
-                    result.overall_risk_level,
-                    len(result.insights),
-                    len(result.prioritized_actions),
-                )
-                return result
+    async def analyze_async(
+        self, profile: SystemProfile, report: ComplianceReport
+    ) -> AIAnalysisResult:
+        """Async variant of :meth:`analyze` for use inside an event loop.
 
-            except json.JSONDecodeError as exc:
-                last_error = exc
-                logger.warning(
-                    "Failed to parse AI analysis JSON (attempt %d/%d): %s",
-                    attempt,
-                    max_attempts,
-                    exc,
-                )
-            except anthropic.APIError as exc:
-                last_error = exc
-                logger.warning(
-                    "Anthropic API error during AI analysis (attempt %d/%d): %s",
-                    attempt,
-                    max_attempts,
-                    exc,
+        Uses :class:`anthropic.AsyncAnthropic`, so the request is awaited on
+        the caller's loop rather than occupying a worker thread.
+
+        Args:
+            profile: The AI system's profile with all declared properties.
+            report: The deterministic compliance report from the rule engine.
+
+        Returns:
+            AIAnalysisResult with executive summary, insights, and recommendations.
+
+        Raises:
+            RuntimeError: If the API call fails after retries or the response
+                cannot be parsed into a valid AIAnalysisResult.
+        """
+        import anthropic
+
+        analysis_id, now, request = self._start_analysis(profile, report)
+
+        last_error: Exception | None = None
+        max_attempts = self.settings.max_judge_retries + 1
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                response = await self.async_client.messages.create(**request)
+                return self._build_result(
+                    response, profile, report, analysis_id, now, attempt, max_attempts
                 )
-            except anthropic.APIConnectionError as exc:
+            except (json.JSONDecodeError, anthropic.APIError) as exc:
                 last_error = exc
-                logger.warning(
-                    "Anthropic API connection error (attempt %d/%d): %s",
-                    attempt,
-                    max_attempts,
-                    exc,
-                )
+                self._log_attempt_failure(exc, attempt, max_attempts)
+                if attempt < max_attempts:
+                    await asyncio.sleep(self._retry_delay(exc, attempt))
 
         raise RuntimeError(
             f"AI analysis failed after {max_attempts} attempts for report "
             f"{report.id}: {last_error}"
         ) from last_error
+
+    async def analyze_many(
+        self, pairs: Iterable[tuple[SystemProfile, ComplianceReport]]
+    ) -> list[AIAnalysisResult | BaseException]:
+        """Analyze several (profile, report) pairs concurrently.
+
+        All requests share :attr:`async_client`, so their round-trips overlap
+        instead of running back to back; each keeps its own retry loop.
+
+        Args:
+            pairs: ``(profile, report)`` pairs to analyze.
+
+        Returns:
+            One entry per pair, in input order: the AIAnalysisResult, or the
+            exception raised by :meth:`analyze_async` for that pair, so one
+            failure does not discard the other results.
+        """
+        return await asyncio.gather(
+            *(self.analyze_async(profile, report) for profile, report in pairs),
+            return_exceptions=True,
+        )
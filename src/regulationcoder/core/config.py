@@ -1,5 +1,7 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -23,9 +25,19 @@ class Settings(BaseSettings):
     # Pipeline
     max_judge_retries: int = 2
     judge_timeout: int = 120
+    # Judge responses keyed by model and prompts (empty string disables the cache)
+    judge_cache_dir: str = "./.judge_cache"
     batch_size: int = 5
 
+    # Code generation (empty string disables the on-disk cache)
+    codegen_cache_dir: str = "./.codegen_cache"
+
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings (cached)."""
+    """Get application settings (cached).
+
+    The environment and ``.env`` are read on the first call only; call
+    ``get_settings.cache_clear()`` to pick up changes.
+    """
     return Settings()
@@ -0,0 +1,57 @@
+"""DiskCache — on-disk store for model responses, one file per key."""
+
+import hashlib
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Cache text under *directory*, keyed by a hash of what produced it.
+
+    An empty *directory* disables the cache: every lookup misses and nothing
+    is written. I/O errors are logged and treated as misses, so a broken cache
+    only costs repeated API calls.
+    """
+
+    def __init__(self, directory: str, suffix: str = ".txt", name: str = "disk") -> None:
+        self.directory = directory
+        self.suffix = suffix
+        self.name = name
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Stable hash of *parts*, e.g. the model and prompts of a request."""
+        payload = "\0".join(parts)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the text stored under *key*, or ``None`` on a miss or when disabled."""
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as fh:
+                return fh.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Could not read %s cache entry %s: %s", self.name, key, e)
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """Store *text* under *key*, replacing the file atomically."""
+        if not self.directory:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write %s cache entry %s: %s", self.name, key, e)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.suffix}")
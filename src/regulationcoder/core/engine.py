@@ -1,8 +1,13 @@
 """ComplianceEngine — main entry point for evaluating system profiles against regulations."""
 
+import ast
 import json
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import CodeType
 
 from regulationcoder.core.config import Settings, get_settings
 from regulationcoder.models.clause import Clause
@@ -15,10 +20,127 @@ from regulationcoder.models.evaluation import (
 )
 from regulationcoder.models.profile import SystemProfile
 from regulationcoder.models.requirement import Requirement
-from regulationcoder.models.rule import Rule
+from regulationcoder.models.rule import Rule, RuleType
 
 logger = logging.getLogger(__name__)
 
+# Verdict strings returned by evaluation functions -> RuleVerdict
+_VERDICTS = {
+    "pass": RuleVerdict.PASS,
+    "fail": RuleVerdict.FAIL,
+    "not_applicable": RuleVerdict.NOT_APPLICABLE,
+    "manual_review": RuleVerdict.MANUAL_REVIEW,
+}
+
+
+_RegulationData = tuple[
+    tuple[Clause, ...],
+    tuple[Requirement, ...],
+    tuple[Rule, ...],
+    dict[str, Callable[[dict], str]],
+]
+
+
+@lru_cache(maxsize=None)
+def _load_regulation_data(regulation: str) -> _RegulationData:
+    """Load a regulation's clauses, requirements and rules once per process.
+
+    Also resolves each rule's registered evaluation function up front, keyed
+    by rule ID. Engines only read this data, so every engine for the same
+    regulation shares it. Unknown regulations load nothing.
+    """
+    if regulation == "eu-ai-act-v1":
+        from regulationcoder.rules.eu_ai_act_v1 import (
+            get_clauses,
+            get_evaluation_function,
+            get_requirements,
+            get_rules,
+        )
+
+        rules = tuple(get_rules())
+        evaluation_functions = {
+            rule.id: fn for rule in rules if (fn := get_evaluation_function(rule.id))
+        }
+        return tuple(get_clauses()), tuple(get_requirements()), rules, evaluation_functions
+    return (), (), (), {}
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedRule:
+    """A rule plus the per-rule values ``evaluate`` needs, derived once."""
+
+    rule: Rule
+    article_ref: str
+    severity: str
+    manual: bool
+
+
+@lru_cache(maxsize=None)
+def _prepare_rules(regulation: str) -> tuple[_PreparedRule, ...]:
+    """Derive article refs, severity strings and manual flags for a regulation's rules."""
+    return tuple(
+        _PreparedRule(
+            rule=rule,
+            article_ref=rule.citations[0].article_ref if rule.citations else "",
+            severity=rule.severity.value,
+            manual=rule.rule_type == RuleType.MANUAL,
+        )
+        for rule in _load_regulation_data(regulation)[2]
+    )
+
+
+@lru_cache(maxsize=4096)
+def _split_field_path(field_path: str) -> tuple[str, ...]:
+    """Split a dotted field path into segments, dropping a ``system_profile.`` prefix."""
+    return tuple(field_path.removeprefix("system_profile.").split("."))
+
+
+# Syntax allowed in evaluation_logic: branches, assignments, boolean logic,
+# comparisons, literals, subscripts and calls. Anything else (attribute
+# access beyond _LOGIC_ATTRIBUTES, dunder names, lambdas, comprehensions,
+# imports, loops, arithmetic) is rejected before the code ever runs.
+_LOGIC_NODES = (
+    ast.Module, ast.If, ast.Assign, ast.Expr, ast.Pass,
+    ast.Name, ast.Load, ast.Store, ast.Constant,
+    ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.IfExp,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.In, ast.NotIn, ast.Is, ast.IsNot,
+    ast.List, ast.Tuple, ast.Set, ast.Dict, ast.Subscript, ast.Call,
+    ast.Attribute,
+)
+_LOGIC_ATTRIBUTES = frozenset({"get"})
+
+
+def _check_logic(tree: ast.AST) -> str | None:
+    """Return why *tree* is not allowed as evaluation_logic, or ``None`` if it is."""
+    for node in ast.walk(tree):
+        if not isinstance(node, _LOGIC_NODES):
+            return f"{type(node).__name__} is not allowed"
+        if isinstance(node, ast.Attribute) and node.attr not in _LOGIC_ATTRIBUTES:
+            return f"attribute '{node.attr}' is not allowed"
+        if isinstance(node, ast.Name) and node.id.startswith("__"):
+            return f"name '{node.id}' is not allowed"
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _compile_logic(evaluation_logic: str) -> CodeType | None:
+    """Compile a rule's ``evaluation_logic`` once.
+
+    Returns ``None`` if it is not valid Python or uses syntax outside the
+    allowed subset, since an empty ``__builtins__`` alone does not stop
+    attribute-based escapes such as ``().__class__.__subclasses__()``.
+    """
+    try:
+        tree = ast.parse(evaluation_logic, "<evaluation_logic>", "exec")
+    except (SyntaxError, ValueError):
+        return None
+    problem = _check_logic(tree)
+    if problem is not None:
+        logger.warning("Rejected evaluation_logic (%s): %r", problem, evaluation_logic)
+        return None
+    return compile(tree, "<evaluation_logic>", "exec")
+
 
 class ComplianceEngine:
     """Evaluate an AI system profile against a set of compliance rules.
@@ -36,25 +158,28 @@ class ComplianceEngine:
     ):
         self.settings = settings or get_settings()
         if anthropic_api_key:
-            self.settings.anthropic_api_key = anthropic_api_key
+            # Copy rather than assign: get_settings() returns one shared object
+            self.settings = self.settings.model_copy(
+                update={"anthropic_api_key": anthropic_api_key}
+            )
         self.regulation = regulation
-        self._clauses: list[Clause] = []
-        self._requirements: list[Requirement] = []
-        self._rules: list[Rule] = []
+        self._clauses: tuple[Clause, ...] = ()
+        self._requirements: tuple[Requirement, ...] = ()
+        self._rules: tuple[Rule, ...] = ()
+        self._evaluation_functions: dict[str, Callable[[dict], str]] = {}
+        self._prepared_rules: tuple[_PreparedRule, ...] = ()
         self._load_regulation()
 
     def _load_regulation(self) -> None:
         """Load pre-built regulation data (clauses, requirements, rules)."""
-        if self.regulation == "eu-ai-act-v1":
-            from regulationcoder.rules.eu_ai_act_v1 import (
-                get_clauses,
-                get_requirements,
-                get_rules,
-            )
-
-            self._clauses = get_clauses()
-            self._requirements = get_requirements()
-            self._rules = get_rules()
+        (
+            self._clauses,
+            self._requirements,
+            self._rules,
+            self._evaluation_functions,
+        ) = _load_regulation_data(self.regulation)
+        self._prepared_rules = _prepare_rules(self.regulation)
+        if self._rules:
             logger.info(
                 "Loaded %d clauses, %d requirements, %d rules for %s",
                 len(self._clauses),
@@ -73,33 +198,34 @@ class ComplianceEngine:
         high_gaps: list[ComplianceGap] = []
         medium_gaps: list[ComplianceGap] = []
 
+        # Low and info gaps are reported alongside medium ones
+        gaps_by_severity = {"critical": critical_gaps, "high": high_gaps}
+        verdict_counts = dict.fromkeys(RuleVerdict, 0)
+
         profile_dict = profile.model_dump()
 
-        for rule in self._rules:
-            result = self._evaluate_rule(rule, profile_dict)
+        for prepared in self._prepared_rules:
+            result = self._evaluate_rule(prepared, profile_dict)
             rule_results.append(result)
+            verdict_counts[result.verdict] += 1
 
             if result.verdict == RuleVerdict.FAIL:
+                rule = prepared.rule
                 gap = ComplianceGap(
                     rule_id=rule.id,
                     requirement_id=rule.requirement_id,
                     description=result.details or rule.title,
-                    severity=rule.severity.value,
+                    severity=prepared.severity,
                     remediation=rule.remediation,
                     article_ref=result.article_ref,
                     citations=rule.citations,
                 )
-                if rule.severity.value == "critical":
-                    critical_gaps.append(gap)
-                elif rule.severity.value == "high":
-                    high_gaps.append(gap)
-                else:
-                    medium_gaps.append(gap)
-
-        passed = sum(1 for r in rule_results if r.verdict == RuleVerdict.PASS)
-        failed = sum(1 for r in rule_results if r.verdict == RuleVerdict.FAIL)
-        na = sum(1 for r in rule_results if r.verdict == RuleVerdict.NOT_APPLICABLE)
-        manual = sum(1 for r in rule_results if r.verdict == RuleVerdict.MANUAL_REVIEW)
+                gaps_by_severity.get(prepared.severity, medium_gaps).append(gap)
+
+        passed = verdict_counts[RuleVerdict.PASS]
+        failed = verdict_counts[RuleVerdict.FAIL]
+        na = verdict_counts[RuleVerdict.NOT_APPLICABLE]
+        manual = verdict_counts[RuleVerdict.MANUAL_REVIEW]
         applicable = passed + failed
         score = round((passed / applicable * 100) if applicable > 0 else 0, 1)
 
@@ -140,22 +266,20 @@ class ComplianceEngine:
         )
         return report
 
-    def _evaluate_rule(self, rule: Rule, profile_dict: dict) -> RuleResult:
+    def _evaluate_rule(self, prepared: _PreparedRule, profile_dict: dict) -> RuleResult:
         """Evaluate a single rule against the profile data."""
-        article_ref = ""
-        if rule.citations:
-            article_ref = rule.citations[0].article_ref
+        rule = prepared.rule
 
         # Check if the rule is manual-only
-        if rule.rule_type.value == "manual":
+        if prepared.manual:
             return RuleResult(
                 rule_id=rule.id,
                 requirement_id=rule.requirement_id,
                 title=rule.title,
                 verdict=RuleVerdict.MANUAL_REVIEW,
-                severity=rule.severity.value,
+                severity=prepared.severity,
                 details="Requires manual assessment",
-                article_ref=article_ref,
+                article_ref=prepared.article_ref,
                 citations=rule.citations,
             )
 
@@ -166,22 +290,15 @@ class ComplianceEngine:
             logger.warning("Error evaluating rule %s: %s", rule.id, e)
             verdict = "manual_review"
 
-        verdict_map = {
-            "pass": RuleVerdict.PASS,
-            "fail": RuleVerdict.FAIL,
-            "not_applicable": RuleVerdict.NOT_APPLICABLE,
-            "manual_review": RuleVerdict.MANUAL_REVIEW,
-        }
-
         return RuleResult(
             rule_id=rule.id,
             requirement_id=rule.requirement_id,
             title=rule.title,
-            verdict=verdict_map.get(verdict, RuleVerdict.MANUAL_REVIEW),
-            severity=rule.severity.value,
+            verdict=_VERDICTS.get(verdict, RuleVerdict.MANUAL_REVIEW),
+            severity=prepared.severity,
             details=rule.description,
             remediation=rule.remediation,
-            article_ref=article_ref,
+            article_ref=prepared.article_ref,
             citations=rule.citations,
         )
 
@@ -191,28 +308,27 @@ class ComplianceEngine:
         Uses a safe evaluation approach — resolves dotted field paths from the
         profile dictionary and applies the rule's evaluation logic.
         """
-        # Resolve inputs from profile
-        inputs = {}
-        for field_path in rule.inputs_needed:
-            value = self._resolve_field(profile_dict, field_path)
-            # Create a simple variable name from the last segment
-            var_name = field_path.split(".")[-1]
-            inputs[var_name] = value
-
         # Execute using the generated evaluation function if available
-        try:
-            from regulationcoder.rules.eu_ai_act_v1 import get_evaluation_function
-
-            eval_fn = get_evaluation_function(rule.id)
-            if eval_fn:
+        eval_fn = self._evaluation_functions.get(rule.id)
+        if eval_fn is not None:
+            try:
                 return eval_fn(profile_dict)
-        except (ImportError, AttributeError):
-            pass
+            except AttributeError:
+                pass
 
         # Fallback: interpret evaluation_logic as simple Python
+        code = _compile_logic(rule.evaluation_logic)
+        if code is None:
+            return "manual_review"
+
+        # Resolve inputs from profile, named after the last path segment
+        inputs = {}
+        for field_path in rule.inputs_needed:
+            parts = _split_field_path(field_path)
+            inputs[parts[-1]] = self._resolve_parts(profile_dict, parts)
         try:
             local_vars = {**inputs, "result": "manual_review"}
-            exec(rule.evaluation_logic, {"__builtins__": {}}, local_vars)  # noqa: S102
+            exec(code, {"__builtins__": {}}, local_vars)  # noqa: S102
             return local_vars.get("result", "manual_review")
         except Exception:
             return "manual_review"
@@ -220,11 +336,11 @@ class ComplianceEngine:
     @staticmethod
     def _resolve_field(data: dict, field_path: str):
         """Resolve a dotted field path like 'system_profile.bias_report.covers_health'."""
-        # Strip 'system_profile.' prefix if present
-        if field_path.startswith("system_profile."):
-            field_path = field_path[len("system_profile."):]
+        return ComplianceEngine._resolve_parts(data, _split_field_path(field_path))
 
-        parts = field_path.split(".")
+    @staticmethod
+    def _resolve_parts(data: dict, parts: tuple[str, ...]):
+        """Walk pre-split field path segments through nested profile dicts."""
         current = data
         for part in parts:
             if isinstance(current, dict):
@@ -0,0 +1,22 @@
+"""Helpers for pulling payloads out of markdown code fences in model responses."""
+
+import re
+from functools import lru_cache
+
+# An unterminated fence (truncated response) runs to the end of the text
+_FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _language_fence_re(language: str) -> re.Pattern[str]:
+    return re.compile(rf"```{re.escape(language)}(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def strip_fences(text: str, language: str) -> str:
+    """Return the payload of *text* without surrounding markdown fences.
+
+    A fence tagged with *language* (e.g. ```json) wins over an earlier bare
+    one. Text without fences is returned as is, minus surrounding whitespace.
+    """
+    match = _language_fence_re(language).search(text) or _FENCE_RE.search(text)
+    return (match.group(1) if match else text).strip()
@@ -4,13 +4,19 @@ Each gate uses Claude Opus as an auditor to verify outputs against source text,
 ensuring no hallucinations, correct modality, and faithful implementation.
 """
 
-import json
+import asyncio
 import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
+from typing import Any, NamedTuple
 
 import anthropic
+import orjson
 
 from regulationcoder.core.config import Settings
+from regulationcoder.core.disk_cache import DiskCache
+from regulationcoder.core.fences import strip_fences
 from regulationcoder.models.judge_report import (
     Finding,
     FindingSeverity,
@@ -22,6 +28,13 @@ from regulationcoder.models.judge_report import (
 
 logger = logging.getLogger(__name__)
 
+# Default number of in-flight requests for JudgeGate.evaluate_many
+_DEFAULT_CONCURRENCY = 8
+
+# Judge-supplied strings -> enum members, without Enum() raising on bad values
+_FINDING_TYPES = {m.value: m for m in FindingType}
+_FINDING_SEVERITIES = {m.value: m for m in FindingSeverity}
+
 # ── Gate A: Requirements Validation ──────────────────────────────────
 
 GATE_A_SYSTEM = """You are a senior legal-AI auditor verifying that extracted regulatory requirements
@@ -183,16 +196,46 @@ Apply the blocking policy:
 - APPROVE otherwise"""
 
 
-class JudgeGate:
-    """Base class for Anthropic judge gates."""
+def _enum_lookup(members: dict, value: Any) -> Any:
+    """Return the enum member for *value*, or ``None`` if it is not a valid value."""
+    return members.get(value) if isinstance(value, str) else None
+
+
+class JudgeRequest(NamedTuple):
+    """Everything a gate sends to the judge for one item."""
+
+    system_prompt: str
+    user_prompt: str
+    stage: str
+    target_ids: list[str]
+
+
+class JudgeGate(ABC):
+    """Base class for Anthropic judge gates.
+
+    Subclasses implement :meth:`_prepare`, which turns their ``evaluate``
+    arguments into a :class:`JudgeRequest`; the base class runs it either
+    synchronously or, via :meth:`evaluate_many`, concurrently.
+    """
 
     def __init__(self, settings: Settings):
         self.settings = settings
         self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
         self.model = settings.judge_model
+        self.cache = DiskCache(settings.judge_cache_dir, name="judge")
 
     def _call_judge(self, system_prompt: str, user_prompt: str) -> dict:
-        """Call the Anthropic judge model and parse the JSON response."""
+        """Call the Anthropic judge model and parse the JSON response.
+
+        Responses that parse are cached on disk under
+        ``settings.judge_cache_dir``, keyed by model and prompts, so re-running
+        a gate on unchanged input skips the API call.
+        """
+        cache_key = DiskCache.key(self.model, system_prompt, user_prompt)
+        text = self.cache.get(cache_key)
+        if text is not None:
+            return self._parse_judge_text(text)
+
         response = self.client.messages.create(
             model=self.model,
             max_tokens=4096,
@@ -200,12 +243,99 @@ class JudgeGate:
             messages=[{"role": "user", "content": user_prompt}],
         )
         text = response.content[0].text
-        # Extract JSON from response (handle markdown code blocks)
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
-        return json.loads(text.strip())
+        raw = self._parse_judge_text(text)
+        self.cache.put(cache_key, text)
+        return raw
+
+    async def _call_judge_async(
+        self, aclient: anthropic.AsyncAnthropic, system_prompt: str, user_prompt: str
+    ) -> dict:
+        """Async counterpart of :meth:`_call_judge` using *aclient*."""
+        cache_key = DiskCache.key(self.model, system_prompt, user_prompt)
+        text = self.cache.get(cache_key)
+        if text is not None:
+            return self._parse_judge_text(text)
+
+        response = await aclient.messages.create(
+            model=self.model,
+            max_tokens=4096,
+            system=system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+        text = response.content[0].text
+        raw = self._parse_judge_text(text)
+        self.cache.put(cache_key, text)
+        return raw
+
+    @abstractmethod
+    def _prepare(self, *args: Any, **kwargs: Any) -> JudgeRequest:
+        """Build the judge request for one item from the gate's ``evaluate`` arguments."""
+
+    def _run(self, request: JudgeRequest) -> JudgeReport:
+        """Send *request* to the judge and build its report."""
+        raw = self._call_judge(request.system_prompt, request.user_prompt)
+        return self._build_report(request.stage, request.target_ids, raw)
+
+    async def evaluate_async(
+        self, aclient: anthropic.AsyncAnthropic, **kwargs: Any
+    ) -> JudgeReport:
+        """Async variant of the gate's ``evaluate``, sending the request through *aclient*."""
+        request = self._prepare(**kwargs)
+        raw = await self._call_judge_async(
+            aclient, request.system_prompt, request.user_prompt
+        )
+        return self._build_report(request.stage, request.target_ids, raw)
+
+    def evaluate_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> list[JudgeReport]:
+        """Validate many items concurrently.
+
+        Requests go through one :class:`anthropic.AsyncAnthropic` client, with
+        at most *concurrency* in flight at once. Cached responses are served
+        from disk without a request. Inside a running event loop, await
+        :meth:`evaluate_async` instead.
+
+        Args:
+            items: Keyword arguments for the gate's ``evaluate``, one mapping per item.
+            concurrency: Maximum number of concurrent API requests.
+
+        Returns:
+            One JudgeReport per item, in the order of *items*.
+
+        Raises:
+            RuntimeError: If called while an event loop is running.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                f"{type(self).__name__}.evaluate_many() cannot run inside an event loop; "
+                "await evaluate_async() for each item instead"
+            )
+        return asyncio.run(self._evaluate_all(list(items), max(1, concurrency)))
+
+    async def _evaluate_all(
+        self, items: list[Mapping[str, Any]], concurrency: int
+    ) -> list[JudgeReport]:
+        """Fan out one task per item over a single shared async client."""
+        sem = asyncio.Semaphore(concurrency)
+
+        async def evaluate_one(item: Mapping[str, Any]) -> JudgeReport:
+            async with sem:
+                return await self.evaluate_async(aclient, **item)
+
+        async with anthropic.AsyncAnthropic(api_key=self.settings.anthropic_api_key) as aclient:
+            return list(await asyncio.gather(*(evaluate_one(item) for item in items)))
+
+    @staticmethod
+    def _parse_judge_text(text: str) -> dict:
+        """Parse the judge's JSON, stripping any markdown code fences."""
+        return orjson.loads(strip_fences(text, "json"))
 
     def _build_report(
         self, stage: str, target_ids: list[str], raw: dict
@@ -222,24 +352,27 @@ class JudgeGate:
         )
         findings = []
         for f in raw.get("findings", []):
-            try:
-                findings.append(
-                    Finding(
-                        finding_type=FindingType(f.get("finding_type", "ambiguity")),
-                        severity=FindingSeverity(f.get("severity", "info")),
+            finding_type = _enum_lookup(_FINDING_TYPES, f.get("finding_type", "ambiguity"))
+            severity = _enum_lookup(_FINDING_SEVERITIES, f.get("severity", "info"))
+            finding = None
+            if finding_type is not None and severity is not None:
+                try:
+                    finding = Finding(
+                        finding_type=finding_type,
+                        severity=severity,
                         description=f.get("description", ""),
                         affected_field=f.get("affected_field", ""),
                         suggested_fix=f.get("suggested_fix", ""),
                     )
+                except ValueError:
+                    pass
+            if finding is None:
+                finding = Finding(
+                    finding_type=FindingType.AMBIGUITY,
+                    severity=FindingSeverity.INFO,
+                    description=f.get("description", str(f)),
                 )
-            except ValueError:
-                findings.append(
-                    Finding(
-                        finding_type=FindingType.AMBIGUITY,
-                        severity=FindingSeverity.INFO,
-                        description=f.get("description", str(f)),
-                    )
-                )
+            findings.append(finding)
 
         now = datetime.now(timezone.utc)
         report_id = f"JUDGE-{stage.upper()}-{'-'.join(target_ids)[:50]}-{now.strftime('%Y%m%d%H%M%S')}"
@@ -269,6 +402,23 @@ class GateA(JudgeGate):
         requirement_json: str,
     ) -> JudgeReport:
         """Validate an extracted requirement against its source clause."""
+        request = self._prepare(
+            clause_id=clause_id,
+            clause_text=clause_text,
+            article_ref=article_ref,
+            parent_context=parent_context,
+            requirement_json=requirement_json,
+        )
+        return self._run(request)
+
+    def _prepare(
+        self,
+        clause_id: str,
+        clause_text: str,
+        article_ref: str,
+        parent_context: str,
+        requirement_json: str,
+    ) -> JudgeRequest:
         user_prompt = GATE_A_USER.format(
             clause_id=clause_id,
             article_ref=article_ref,
@@ -277,8 +427,7 @@ class GateA(JudgeGate):
             requirement_json=requirement_json,
         )
         logger.info("Gate A evaluating requirement for clause %s", clause_id)
-        raw = self._call_judge(GATE_A_SYSTEM, user_prompt)
-        return self._build_report("gate_a_extraction", [clause_id], raw)
+        return JudgeRequest(GATE_A_SYSTEM, user_prompt, "gate_a_extraction", [clause_id])
 
 
 class GateB(JudgeGate):
@@ -288,14 +437,20 @@ class GateB(JudgeGate):
         self, requirement_json: str, rule_json: str
     ) -> JudgeReport:
         """Validate a formalized rule against its source requirement."""
+        request = self._prepare(requirement_json=requirement_json, rule_json=rule_json)
+        return self._run(request)
+
+    def _prepare(self, requirement_json: str, rule_json: str) -> JudgeRequest:
         user_prompt = GATE_B_USER.format(
             requirement_json=requirement_json,
             rule_json=rule_json,
         )
-        raw = self._call_judge(GATE_B_SYSTEM, user_prompt)
-        rule_data = json.loads(rule_json)
-        return self._build_report(
-            "gate_b_formalization", [rule_data.get("id", "unknown")], raw
+        rule_data = orjson.loads(rule_json)
+        return JudgeRequest(
+            GATE_B_SYSTEM,
+            user_prompt,
+            "gate_b_formalization",
+            [rule_data.get("id", "unknown")],
         )
 
 
@@ -306,15 +461,27 @@ class GateC(JudgeGate):
         self, rule_json: str, generated_code: str, test_code: str
     ) -> JudgeReport:
         """Validate generated code against its source rule."""
+        request = self._prepare(
+            rule_json=rule_json,
+            generated_code=generated_code,
+            test_code=test_code,
+        )
+        return self._run(request)
+
+    def _prepare(
+        self, rule_json: str, generated_code: str, test_code: str
+    ) -> JudgeRequest:
         user_prompt = GATE_C_USER.format(
             rule_json=rule_json,
             generated_code=generated_code,
             test_code=test_code,
         )
-        raw = self._call_judge(GATE_C_SYSTEM, user_prompt)
-        rule_data = json.loads(rule_json)
-        return self._build_report(
-            "gate_c_codegen", [rule_data.get("id", "unknown")], raw
+        rule_data = orjson.loads(rule_json)
+        return JudgeRequest(
+            GATE_C_SYSTEM,
+            user_prompt,
+            "gate_c_codegen",
+            [rule_data.get("id", "unknown")],
         )
 
 
@@ -329,13 +496,27 @@ class GateD(JudgeGate):
         impact_json: str,
     ) -> JudgeReport:
         """Validate a diff impact analysis."""
+        request = self._prepare(
+            old_version=old_version,
+            new_version=new_version,
+            changes_json=changes_json,
+            impact_json=impact_json,
+        )
+        return self._run(request)
+
+    def _prepare(
+        self,
+        old_version: str,
+        new_version: str,
+        changes_json: str,
+        impact_json: str,
+    ) -> JudgeRequest:
         user_prompt = GATE_D_USER.format(
             old_version=old_version,
             new_version=new_version,
             changes_json=changes_json,
             impact_json=impact_json,
         )
-        raw = self._call_judge(GATE_D_SYSTEM, user_prompt)
-        return self._build_report(
-            "gate_d_diff", [f"{old_version}->{new_version}"], raw
+        return JudgeRequest(
+            GATE_D_SYSTEM, user_prompt, "gate_d_diff", [f"{old_version}->{new_version}"]
         )
@@ -25,9 +25,15 @@ class PipelineOrchestrator:
     5. Code Generation — Rules → Python evaluation functions (+ Gate C)
     """
 
-    def __init__(self, settings: Settings | None = None):
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        audit_logger: AuditLogger | None = None,
+    ):
         self.settings = settings or get_settings()
-        self.audit = AuditLogger(self.settings.audit_log_dir)
+        # Share the caller's logger when there is one: two loggers on the
+        # same file would each chain from their own last hash.
+        self.audit = audit_logger or AuditLogger(self.settings.audit_log_dir)
         self.gate_a = GateA(self.settings)
         self.gate_b = GateB(self.settings)
         self.gate_c = GateC(self.settings)
@@ -92,30 +98,34 @@ class PipelineOrchestrator:
         all_requirements: list[Requirement] = []
         all_reports: list[JudgeReport] = []
 
+        candidates: list[Requirement] = []
+        gate_items: list[dict[str, str]] = []
         for clause in clauses:
-            requirements = extractor.extract(clause)
-
-            for req in requirements:
-                # Gate A validation
-                parent_context = f"Article {clause.article_number}"
-                report = self.gate_a.evaluate(
-                    clause_id=clause.id,
-                    clause_text=clause.text,
-                    article_ref=f"Article {clause.article_number}",
-                    parent_context=parent_context,
-                    requirement_json=req.model_dump_json(indent=2),
+            for req in extractor.extract(clause):
+                candidates.append(req)
+                gate_items.append(
+                    {
+                        "clause_id": clause.id,
+                        "clause_text": clause.text,
+                        "article_ref": f"Article {clause.article_number}",
+                        "parent_context": f"Article {clause.article_number}",
+                        "requirement_json": req.model_dump_json(indent=2),
+                    }
                 )
-                all_reports.append(report)
-
-                if report.verdict == Verdict.APPROVE:
-                    all_requirements.append(req)
-                    logger.info("Gate A APPROVED: %s", req.id)
-                elif report.verdict == Verdict.REVISE:
-                    logger.warning("Gate A REVISE: %s — %s", req.id, report.findings)
-                    # Accept with warnings for now
-                    all_requirements.append(req)
-                else:
-                    logger.error("Gate A BLOCKED: %s — %s", req.id, report.findings)
+
+        # Gate A validation, all requirements in one concurrent batch
+        for req, report in zip(candidates, self.gate_a.evaluate_many(gate_items)):
+            all_reports.append(report)
+
+            if report.verdict == Verdict.APPROVE:
+                all_requirements.append(req)
+                logger.info("Gate A APPROVED: %s", req.id)
+            elif report.verdict == Verdict.REVISE:
+                logger.warning("Gate A REVISE: %s — %s", req.id, report.findings)
+                # Accept with warnings for now
+                all_requirements.append(req)
+            else:
+                logger.error("Gate A BLOCKED: %s — %s", req.id, report.findings)
 
         self.audit.log(
             action=AuditAction.EXTRACT,
@@ -141,14 +151,18 @@ class PipelineOrchestrator:
         all_rules: list[Rule] = []
         all_reports: list[JudgeReport] = []
 
-        for req in requirements:
-            rule = generator.generate(req)
+        rules = [generator.generate(req) for req in requirements]
 
-            # Gate B validation
-            report = self.gate_b.evaluate(
-                requirement_json=req.model_dump_json(indent=2),
-                rule_json=rule.model_dump_json(indent=2),
-            )
+        # Gate B validation, all rules in one concurrent batch
+        reports = self.gate_b.evaluate_many(
+            {
+                "requirement_json": req.model_dump_json(indent=2),
+                "rule_json": rule.model_dump_json(indent=2),
+            }
+            for req, rule in zip(requirements, rules)
+        )
+
+        for rule, report in zip(rules, reports):
             all_reports.append(report)
 
             if report.verdict in (Verdict.APPROVE, Verdict.REVISE):
@@ -182,16 +196,20 @@ class PipelineOrchestrator:
         test_files: dict[str, str] = {}
         all_reports: list[JudgeReport] = []
 
-        for rule in rules:
-            code = sdk_gen.generate(rule)
-            tests = test_gen.generate(rule)
+        codes = sdk_gen.generate_many(rules)
+        all_tests = [test_gen.generate(rule) for rule in rules]
+
+        # Gate C validation, all rules in one concurrent batch
+        reports = self.gate_c.evaluate_many(
+            {
+                "rule_json": rule.model_dump_json(indent=2),
+                "generated_code": code,
+                "test_code": tests,
+            }
+            for rule, code, tests in zip(rules, codes, all_tests)
+        )
 
-            # Gate C validation
-            report = self.gate_c.evaluate(
-                rule_json=rule.model_dump_json(indent=2),
-                generated_code=code,
-                test_code=tests,
-            )
+        for rule, code, tests, report in zip(rules, codes, all_tests, reports):
             all_reports.append(report)
 
             if report.verdict in (Verdict.APPROVE, Verdict.REVISE):
@@ -1,6 +1,5 @@
 """JSON exporter for ComplianceReport."""
 
-import json
 import logging
 import os
 
@@ -21,9 +20,7 @@ def export_report_json(report: ComplianceReport, path: str) -> None:
     """
     os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
 
-    data = report.model_dump(mode="json")
-
     with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2, ensure_ascii=False, default=str)
+        fh.write(report.model_dump_json(indent=2))
 
     logger.info("Compliance report exported to JSON: %s", path)
@@ -31,6 +31,14 @@ from regulationcoder.rules.eu_ai_act_v1 import (
 
 _ARTICLE_MODULES = [art09, art10, art11, art12, art13, art14, art15]
 
+# Flattened once at import; the getters hand out shallow copies so callers
+# can't mutate the shared seed data.
+_CLAUSES: tuple[Clause, ...] = tuple(c for mod in _ARTICLE_MODULES for c in mod.CLAUSES)
+_REQUIREMENTS: tuple[Requirement, ...] = tuple(
+    r for mod in _ARTICLE_MODULES for r in mod.REQUIREMENTS
+)
+_RULES: tuple[Rule, ...] = tuple(r for mod in _ARTICLE_MODULES for r in mod.RULES)
+
 
 def get_regulation() -> Regulation:
     """Return the EU AI Act regulation metadata."""
@@ -43,32 +51,23 @@ def get_regulation() -> Regulation:
         language="en",
         source_url="https://eur-lex.europa.eu/eli/reg/2024/1689/oj",
         total_articles=113,
-        total_clauses=len(get_clauses()),
+        total_clauses=len(_CLAUSES),
     )
 
 
 def get_clauses() -> list[Clause]:
     """Return all clauses from Articles 9-15."""
-    clauses: list[Clause] = []
-    for mod in _ARTICLE_MODULES:
-        clauses.extend(mod.CLAUSES)
-    return clauses
+    return list(_CLAUSES)
 
 
 def get_requirements() -> list[Requirement]:
     """Return all requirements from Articles 9-15."""
-    requirements: list[Requirement] = []
-    for mod in _ARTICLE_MODULES:
-        requirements.extend(mod.REQUIREMENTS)
-    return requirements
+    return list(_REQUIREMENTS)
 
 
 def get_rules() -> list[Rule]:
     """Return all rules from Articles 9-15."""
-    rules: list[Rule] = []
-    for mod in _ARTICLE_MODULES:
-        rules.extend(mod.RULES)
-    return rules
+    return list(_RULES)
 
 
 def get_evaluation_function(rule_id: str) -> Callable[..., str] | None:
@@ -1,9 +1,12 @@
 """Shared test fixtures for RegulationCoder."""
 
+import asyncio
 import json
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
+from regulationcoder.core.config import Settings, get_settings
 from regulationcoder.models.citation import Citation
 from regulationcoder.models.clause import Clause
 from regulationcoder.models.requirement import Condition, Modality, Requirement
@@ -14,6 +17,88 @@ from regulationcoder.models.profile import BiasExaminationReport, SystemProfile
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    """Rebuild settings per test so monkeypatched env vars take effect."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+class FakeMessages:
+    """Stand-in for ``Anthropic().messages`` that replies with *text* and counts calls."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+class FakeAsyncMessages:
+    """Async counterpart of :class:`FakeMessages` that also tracks peak concurrency."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+@pytest.fixture
+def fake_anthropic():
+    """Build a generator or gate on test settings with a :class:`FakeMessages` client.
+
+    Call it as ``fake_anthropic(cls, cache_dir, text)``; it returns the instance
+    and its messages stub. *cache_dir* is used for every response cache.
+    """
+
+    def build(cls, cache_dir: str, text: str = ""):
+        settings = Settings(
+            anthropic_api_key="test", codegen_cache_dir=cache_dir, judge_cache_dir=cache_dir
+        )
+        owner = cls(settings)
+        messages = FakeMessages(text)
+        owner.client = SimpleNamespace(messages=messages)
+        return owner, messages
+
+    return build
+
+
+@pytest.fixture
+def fake_async_anthropic(monkeypatch):
+    """Patch ``anthropic.AsyncAnthropic`` to reply with *text*; returns the shared messages."""
+    import anthropic
+
+    def install(text: str) -> FakeAsyncMessages:
+        messages = FakeAsyncMessages(text)
+
+        class FakeAsyncClient:
+            def __init__(self, **kwargs):
+                self.messages = messages
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return None
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", FakeAsyncClient)
+        return messages
+
+    return install
+
+
 @pytest.fixture
 def sample_clause() -> Clause:
     return Clause(
@@ -0,0 +1,79 @@
+"""Unit tests for the AI compliance analyzer helpers."""
+
+import json
+
+from regulationcoder.core.ai_analyzer import ComplianceAnalyzer
+
+
+class TestRepairTruncatedJson:
+    def test_closes_brackets_in_nesting_order(self):
+        repaired = ComplianceAnalyzer._repair_truncated_json('{"a": [{"b": [1, 2')
+        assert json.loads(repaired) == {"a": [{"b": [1, 2]}]}
+
+    def test_closes_open_string_and_strips_fences(self):
+        text = '```json\n{"summary": "cut \\"mid\\" sent'
+        assert json.loads(ComplianceAnalyzer._repair_truncated_json(text)) == {
+            "summary": 'cut "mid" sent'
+        }
+
+    def test_drops_dangling_escape_and_trailing_comma(self):
+        assert json.loads(ComplianceAnalyzer._repair_truncated_json('{"a": "x\\')) == {"a": "x"}
+        assert json.loads(ComplianceAnalyzer._repair_truncated_json('{"a": [1, 2,\n')) == {
+            "a": [1, 2]
+        }
+
+    def test_complete_json_is_unchanged(self):
+        text = '{"a": ["}", "]"], "b": {"c": "\\\\"}}'
+        assert ComplianceAnalyzer._repair_truncated_json(text) == text
+
+
+class TestParseResponse:
+    def test_strips_json_and_bare_fences(self):
+        analyzer = ComplianceAnalyzer.__new__(ComplianceAnalyzer)
+        assert analyzer._parse_response('{"a": 1}') == {"a": 1}
+        assert analyzer._parse_response('Here it is:\n```json\n{"a": 1}\n```') == {"a": 1}
+        assert analyzer._parse_response('```\n{"a": 1}\n```\n') == {"a": 1}
+
+
+class TestAnalyzeMany:
+    def test_returns_results_and_errors_in_order(self, talentscreen_profile):
+        import asyncio
+
+        analyzer = ComplianceAnalyzer.__new__(ComplianceAnalyzer)
+
+        async def fake_analyze_async(profile, report):
+            await asyncio.sleep(0.01 if report == "slow" else 0)
+            if report == "bad":
+                raise RuntimeError("boom")
+            return report
+
+        analyzer.analyze_async = fake_analyze_async
+        pairs = [(talentscreen_profile, r) for r in ("slow", "bad", "fast")]
+        results = asyncio.run(analyzer.analyze_many(pairs))
+        assert results[0] == "slow"
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == "fast"
+
+
+class TestRetryDelay:
+    @staticmethod
+    def _rate_limit_error(headers: dict[str, str]):
+        import anthropic
+        import httpx
+
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        response = httpx.Response(429, headers=headers, request=request)
+        return anthropic.RateLimitError("rate limited", response=response, body=None)
+
+    def test_backs_off_exponentially_with_jitter(self):
+        exc = self._rate_limit_error({})
+        for attempt, base in ((1, 0.5), (2, 1.0), (3, 2.0)):
+            delay = ComplianceAnalyzer._retry_delay(exc, attempt)
+            assert 0.5 * base <= delay <= 1.5 * base
+        assert ComplianceAnalyzer._retry_delay(exc, 20) <= 45.0
+
+    def test_honors_retry_after_and_skips_json_errors(self):
+        exc = self._rate_limit_error({"retry-after": "3"})
+        assert ComplianceAnalyzer._retry_delay(exc, 1) == 3.0
+        parse_error = json.JSONDecodeError("bad", "{", 0)
+        assert ComplianceAnalyzer._retry_delay(parse_error, 1) == 0.0
@@ -0,0 +1,186 @@
+"""Unit tests for the FastAPI routers."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from regulationcoder.api.app import app
+from regulationcoder.api.routers import evaluate, upload
+from regulationcoder.audit.logger import AuditLogger
+from regulationcoder.models.audit_entry import AuditAction
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # Settings are cached per test (see conftest), so this reaches the app
+    monkeypatch.setenv("AUDIT_LOG_DIR", str(tmp_path))
+    with TestClient(app) as c:
+        audit_logger = AuditLogger(str(tmp_path))
+        audit_logger.log(action=AuditAction.INGEST, stage="ingestion", target_ids=["a"])
+        audit_logger.log(action=AuditAction.PARSE, stage="parsing", target_ids=["b"])
+        audit_logger.log(action=AuditAction.PARSE, stage="parsing", actor="reviewer")
+        app.state.audit_logger = audit_logger
+        yield c
+
+
+@pytest.fixture
+def profile():
+    fixture = Path(__file__).parents[1] / "fixtures" / "talentscreen_profile.json"
+    return json.loads(fixture.read_text())
+
+
+class TestAuditRouter:
+    def test_list_logs_newest_first(self, client):
+        entries = client.get("/api/audit/logs").json()
+        assert [e["action"] for e in entries] == ["parse", "parse", "ingest"]
+
+    def test_list_logs_filters(self, client):
+        entries = client.get(
+            "/api/audit/logs", params={"action": "parse", "actor": "reviewer"}
+        ).json()
+        assert len(entries) == 1
+        assert entries[0]["actor"] == "reviewer"
+
+        assert client.get("/api/audit/logs", params={"stage": "missing"}).json() == []
+        assert len(client.get("/api/audit/logs", params={"limit": 2}).json()) == 2
+
+    def test_verify(self, client):
+        log_dir = client.app.state.audit_logger.log_dir
+        result = client.get("/api/audit/verify", params={"log_dir": log_dir}).json()
+        assert result["is_valid"] is True
+        assert result["total_entries"] == 3
+
+    def test_verify_other_log_dir_not_cached(self, client, tmp_path):
+        from regulationcoder.api.routers import audit
+
+        other_dir = tmp_path / "other"
+        AuditLogger(str(other_dir)).log(action=AuditAction.INGEST, stage="ingestion")
+        params = {"log_dir": str(other_dir)}
+        result = client.get("/api/audit/verify", params=params).json()
+        assert result["total_entries"] == 1
+        assert not any(path.startswith(str(other_dir)) for path in audit._entries_cache)
+
+
+class TestRegulationIndexes:
+    def test_list_clauses_by_regulation(self, client, monkeypatch):
+        store = client.app.state.store
+        monkeypatch.setitem(store["regulations"], "eu-ai-act-v1", store["regulations"]["eu-ai-act"])
+        clauses = client.get("/api/regulations/eu-ai-act-v1/clauses").json()
+        assert len(clauses) == len(store["clauses"])
+        assert all(c["regulation_id"] == "eu-ai-act-v1" for c in clauses)
+        assert client.get("/api/regulations/eu-ai-act/clauses").json() == []
+
+    def test_list_requirements_prefix_filter(self, client):
+        def list_requirements(regulation_id: str) -> list[dict]:
+            params = {"regulation_id": regulation_id}
+            return client.get("/api/requirements/", params=params).json()
+
+        total = len(client.get("/api/requirements/").json())
+        assert len(list_requirements("eu-ai-act")) == total
+        assert len(list_requirements("eu-ai-act-v1")) == total
+        art10 = list_requirements("eu-ai-act-v1/art10")
+        assert art10
+        assert all(r["clause_id"].startswith("eu-ai-act-v1/art10") for r in art10)
+        assert client.get("/api/requirements/", params={"regulation_id": "gdpr"}).json() == []
+
+    def test_list_rules_by_regulation_prefix(self, client):
+        total = len(client.get("/api/rules/").json())
+        for regulation_id in ("eu-ai-act", "EU-AI"):
+            rules = client.get("/api/rules/", params={"regulation_id": regulation_id}).json()
+            assert len(rules) == total
+        assert client.get("/api/rules/", params={"regulation_id": "gdpr"}).json() == []
+
+
+class TestEvaluateRouter:
+    def test_repeat_evaluation_uses_cache(self, client, profile, monkeypatch):
+        monkeypatch.setattr(evaluate, "_evaluation_cache", type(evaluate._evaluation_cache)())
+
+        first = client.post("/api/evaluate/", json=profile).json()
+        monkeypatch.setitem(client.app.state.engines, "eu-ai-act-v1", None)  # a miss would now fail
+        second = client.post("/api/evaluate/", json=profile).json()
+
+        assert second["summary"] == first["summary"]
+        assert second["rule_results"] == first["rule_results"]
+        assert len(evaluate._evaluation_cache) == 1
+
+    def test_cache_hit_does_not_share_lists(self, client, profile, monkeypatch):
+        from regulationcoder.models.profile import SystemProfile
+
+        monkeypatch.setattr(evaluate, "_evaluation_cache", type(evaluate._evaluation_cache)())
+        engine = client.app.state.engines["eu-ai-act-v1"]
+        system_profile = SystemProfile(**profile)
+
+        evaluate._evaluate(engine, system_profile)
+        hit = evaluate._evaluate(engine, system_profile)
+        hit.rule_results.clear()
+
+        cached = next(iter(evaluate._evaluation_cache.values()))
+        assert cached.rule_results
+
+    def test_list_reports_includes_new_report(self, client, profile):
+        report = client.post("/api/evaluate/", json=profile).json()
+        response = client.get("/api/evaluate/reports")
+        assert response.headers["content-type"] == "application/json"
+        assert report in response.json()
+
+
+class TestUploadRouter:
+    def test_upload_text_document(self, client):
+        body = b"Article 1\nSubject matter\n1. This Regulation lays down rules.\n"
+        response = client.post(
+            "/api/upload/",
+            files={"file": ("reg.txt", body)},
+            params={"regulation_id": "test-upload"},
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["file_size"] == len(body)
+        indexed = client.app.state.store["clauses_by_reg"]["test-upload"]
+        assert len(indexed) == result["clauses_extracted"]
+
+    def test_upload_rejects_empty_file(self, client):
+        response = client.post("/api/upload/", files={"file": ("reg.txt", b"")})
+        assert response.status_code == 400
+
+    def test_upload_rejects_unsupported_extension(self, client):
+        response = client.post("/api/upload/", files={"file": ("reg.docx", b"data")})
+        assert response.status_code == 400
+        assert response.json()["detail"] == (
+            "Unsupported file type '.docx'. Allowed: .pdf, .html, .htm, .txt"
+        )
+
+    def test_upload_rejects_oversized_stream(self, client, monkeypatch):
+        # Content-Length passes the app's pre-check; the streamed copy trips the cap
+        monkeypatch.setattr(upload, "MAX_UPLOAD_BYTES", 8)
+        response = client.post("/api/upload/", files={"file": ("reg.txt", b"x" * 9)})
+        assert response.status_code == 413
+        assert response.json()["detail"] == upload.TOO_LARGE_DETAIL
+
+    def test_upload_rejects_oversized_content_length(self, client, monkeypatch):
+        # Refused from the header alone, before the body is read
+        monkeypatch.setattr(upload, "MAX_UPLOAD_REQUEST_BYTES", 8)
+        response = client.post("/api/upload/", files={"file": ("reg.txt", b"x" * 9)})
+        assert response.status_code == 413
+        assert response.json()["detail"] == upload.TOO_LARGE_DETAIL
+
+
+class TestConditionalGet:
+    def test_etag_revalidation(self, client, profile):
+        first = client.get("/api/rules/")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "private, no-cache"
+
+        cached = client.get("/api/rules/", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        # Any store write invalidates the validator
+        client.post("/api/evaluate/", json=profile)
+        refreshed = client.get("/api/rules/", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["etag"] != etag
+
+    def test_audit_logs_not_etagged(self, client):
+        assert "etag" not in client.get("/api/audit/logs").headers
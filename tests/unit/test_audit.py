@@ -48,3 +48,113 @@ class TestAuditLogger:
             is_valid, errors = verifier.verify(tmpdir)
             assert is_valid is True
             assert len(errors) == 0
+
+    def test_entries_written_before_log_returns(self):
+        from regulationcoder.audit.logger import AuditLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(tmpdir)
+            logger.log(action=AuditAction.INGEST, stage="s1", target_ids=["a"])
+            lines = (Path(tmpdir) / "audit.jsonl").read_text().splitlines()
+            assert len(lines) == 1
+
+            logger.close()
+            logger.log(action=AuditAction.PARSE, stage="s2", target_ids=["b"])
+            entries = logger.load_from_file()
+            assert len(entries) == 2
+            assert AuditLogger.verify_chain(entries) == (True, [])
+            logger.close()
+
+    def test_verify_chain_detects_tampering(self):
+        from regulationcoder.audit.logger import AuditLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(tmpdir)
+            logger.log(action=AuditAction.INGEST, stage="s1", target_ids=["a"])
+            logger.log(action=AuditAction.PARSE, stage="s2", details={"count": 2})
+            logger.log(action=AuditAction.EXTRACT, stage="s3", target_ids=["c"])
+
+            entries = logger.load_from_file()
+            entries[1] = entries[1].model_copy(update={"details": {"count": 3}})
+
+            is_valid, errors = AuditLogger.verify_chain(entries)
+            assert is_valid is False
+            assert len(errors) == 1
+            assert "hash mismatch" in errors[0]
+
+    def test_verify_chain_streams_from_file(self):
+        from regulationcoder.audit.logger import AuditLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(tmpdir)
+            logger.log(action=AuditAction.INGEST, stage="s1", target_ids=["a"])
+            logger.log(action=AuditAction.PARSE, stage="s2", target_ids=["b"])
+
+            entries = logger.iter_from_file()
+            assert not isinstance(entries, list)
+            assert AuditLogger.verify_chain(entries) == (True, [])
+
+    def test_resume_reads_last_hash_from_tail(self, monkeypatch):
+        from regulationcoder.audit import logger as logger_module
+        from regulationcoder.audit.logger import AuditLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = AuditLogger(tmpdir)
+            first.log(action=AuditAction.INGEST, stage="s1", details={"blob": "x" * 300})
+            last = first.log(action=AuditAction.PARSE, stage="s2", details={"blob": "y" * 300})
+            with open(first.log_file, "a", encoding="utf-8") as fh:
+                fh.write("\n\n")
+
+            # A window smaller than one line forces the read to grow
+            monkeypatch.setattr(logger_module, "_TAIL_WINDOW", 16)
+            resumed = AuditLogger(tmpdir)
+            entry = resumed.log(action=AuditAction.EXTRACT, stage="s3")
+            assert entry.previous_hash == last.entry_hash
+
+
+class TestAuditChainVerifier:
+    def test_checkpoint_resumes_and_detects_prefix_tampering(self):
+        from regulationcoder.audit.chain import AuditChainVerifier
+        from regulationcoder.audit.logger import AuditLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(tmpdir)
+            logger.log(action=AuditAction.INGEST, stage="s1", details={"count": 1})
+            logger.log(action=AuditAction.PARSE, stage="s2", details={"count": 2})
+
+            verifier = AuditChainVerifier()
+            assert verifier.verify(tmpdir, use_checkpoint=True) == (True, [])
+            checkpoint = json.loads((Path(tmpdir) / "audit.verified.json").read_text())
+            assert checkpoint["entries"] == 2
+
+            logger.log(action=AuditAction.EXTRACT, stage="s3")
+            assert verifier.verify(tmpdir, use_checkpoint=True) == (True, [])
+            checkpoint = json.loads((Path(tmpdir) / "audit.verified.json").read_text())
+            assert checkpoint["entries"] == 3
+
+            log_file = Path(logger.log_file)
+            log_file.write_text(log_file.read_text().replace('"count":1', '"count":9'))
+            is_valid, errors = verifier.verify(tmpdir, use_checkpoint=True)
+            assert is_valid is False
+            assert "entry_hash mismatch" in errors[0]
+
+    def test_fast_mode_checks_linkage_only(self):
+        from regulationcoder.audit.chain import AuditChainVerifier
+        from regulationcoder.audit.logger import AuditLogger
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = AuditLogger(tmpdir)
+            logger.log(action=AuditAction.INGEST, stage="s1", details={"count": 1})
+            logger.log(action=AuditAction.PARSE, stage="s2")
+
+            log_file = Path(logger.log_file)
+            log_file.write_text(log_file.read_text().replace('"count":1', '"count":9'))
+            verifier = AuditChainVerifier()
+            assert verifier.verify(tmpdir, fast_mode=True) == (True, [])
+            assert verifier.verify(tmpdir)[0] is False
+
+            lines = log_file.read_text().splitlines()
+            log_file.write_text(lines[1] + "\n")
+            is_valid, errors = verifier.verify(tmpdir, fast_mode=True)
+            assert is_valid is False
+            assert "previous_hash mismatch" in errors[0]
@@ -0,0 +1,152 @@
+"""Unit tests for the code generators."""
+
+from regulationcoder.codegen.sdk_generator import SDKGenerator
+
+_GENERATED = (
+    "def evaluate_eu_ai_act_010_02f_001(profile: dict) -> str:\n"
+    "    return 'pass'"
+)
+_REPLY = f"```python\n{_GENERATED}\n```"
+
+
+class TestSDKGenerator:
+    def test_generate_caches_on_disk(self, sample_rule, tmp_path, fake_anthropic):
+        generator, messages = fake_anthropic(SDKGenerator, str(tmp_path), _REPLY)
+        assert generator.generate(sample_rule) == _GENERATED
+        assert messages.calls == 1
+        assert len(list(tmp_path.glob("*.py"))) == 1
+
+        # A fresh generator (new process) reads the same entry
+        generator, messages = fake_anthropic(SDKGenerator, str(tmp_path), _REPLY)
+        assert generator.generate(sample_rule) == _GENERATED
+        assert messages.calls == 0
+
+    def test_cache_key_changes_with_rule(self, sample_rule, tmp_path, fake_anthropic):
+        generator, messages = fake_anthropic(SDKGenerator, str(tmp_path), _REPLY)
+        generator.generate(sample_rule)
+        generator.generate(sample_rule.model_copy(update={"remediation": "Do it."}))
+        assert messages.calls == 2
+
+    def test_empty_cache_dir_disables_cache(
+        self, sample_rule, tmp_path, monkeypatch, fake_anthropic
+    ):
+        monkeypatch.chdir(tmp_path)
+        generator, messages = fake_anthropic(SDKGenerator, "", _REPLY)
+        generator.generate(sample_rule)
+        generator.generate(sample_rule)
+        assert messages.calls == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_generate_many_bounds_concurrency_and_uses_cache(
+        self, sample_rule, tmp_path, fake_anthropic, fake_async_anthropic
+    ):
+        messages = fake_async_anthropic(_GENERATED)
+        rules = [
+            sample_rule.model_copy(update={"remediation": f"Step {i}."}) for i in range(6)
+        ]
+        generator, _ = fake_anthropic(SDKGenerator, str(tmp_path))
+
+        codes = generator.generate_many(rules, concurrency=2)
+        assert codes == [_GENERATED] * 6
+        assert messages.calls == 6
+        assert messages.peak == 2
+
+        assert generator.generate_many(rules) == codes
+        assert messages.calls == 6
+
+    def test_extract_python_code_strips_fences(self):
+        extract = SDKGenerator._extract_python_code
+        generator = SDKGenerator.__new__(SDKGenerator)
+        assert extract(generator, "x = 1", "R") == "x = 1"
+        assert extract(generator, "Here:\n```python\nx = 1\n```\nDone.", "R") == "x = 1"
+        assert extract(generator, "```\nx = 1\n```", "R") == "x = 1"
+        assert extract(generator, "```python\nx = 1", "R") == "x = 1"
+        assert extract(generator, "```\nnote\n```\n```python\nx = 1\n```", "R") == "x = 1"
+
+    def test_rule_id_to_snake(self):
+        expected = "eu_ai_act_010_02f_001"
+        assert SDKGenerator._rule_id_to_snake("RULE-EU-AI-ACT-010-02F-001") == expected
+        assert SDKGenerator._rule_id_to_snake("rule-EU-AI-ACT-009") == "eu_ai_act_009"
+        assert SDKGenerator._rule_id_to_snake("EU-AI-ACT-009") == "eu_ai_act_009"
+
+    def test_wrap_code_adds_signature_and_docstring(self, sample_rule):
+        code = SDKGenerator._wrap_code(
+            "x = 1\n\nreturn 'pass'", sample_rule, "eu_ai_act_010_02f_001", "Article 10"
+        )
+        assert code.startswith("def evaluate_eu_ai_act_010_02f_001(profile: dict) -> str:\n")
+        assert "    Source: Article 10\n" in code
+        assert code.endswith("    \"\"\"\n    x = 1\n\n    return 'pass'\n")
+        compile(code, "<wrapped>", "exec")
+
+
+class TestMappingGenerator:
+    def test_generate_groups_by_article(self, sample_rule, sample_requirement):
+        from regulationcoder.codegen.mapping_generator import MappingGenerator
+
+        uncited = sample_requirement.model_copy(
+            update={"id": "REQ-EU-AI-ACT-013-01-001", "citations": []}
+        )
+        mapping = MappingGenerator().generate([sample_rule], [sample_requirement, uncited])
+
+        assert list(mapping["articles"]) == ["Article 10", "Article 13"]
+        article_10 = mapping["articles"]["Article 10"]["requirements"][0]
+        assert [r["rule_id"] for r in article_10["rules"]] == [sample_rule.id]
+        assert mapping["rule_to_requirement"] == {sample_rule.id: sample_requirement.id}
+        assert mapping["requirement_to_clause"][uncited.id] == uncited.clause_id
+
+    def test_articles_sorted_numerically(self, sample_requirement):
+        from regulationcoder.codegen.mapping_generator import MappingGenerator
+
+        requirements = [
+            sample_requirement.model_copy(
+                update={
+                    "id": f"REQ-EU-AI-ACT-{art:03d}-01-001",
+                    "citations": [],
+                }
+            )
+            for art in (10, 2, 9)
+        ]
+        requirements.append(
+            sample_requirement.model_copy(update={"id": "REQ-OTHER", "citations": []})
+        )
+        mapping = MappingGenerator().generate([], requirements)
+        assert list(mapping["articles"]) == [
+            "Article 2",
+            "Article 9",
+            "Article 10",
+            "Unknown Article",
+        ]
+
+
+class TestTestGenerator:
+    def test_generate_emits_one_test_per_case(self, sample_rule):
+        from regulationcoder.codegen.test_generator import TestGenerator
+
+        code = TestGenerator().generate(sample_rule)
+        compile(code, "<tests>", "exec")
+        assert code.count("\ndef test_") == len(sample_rule.test_cases)
+        assert "def test_tc_001():" in code
+        assert "from regulationcoder.rules.generated import evaluate_eu_ai_act_010_02f_001" in code
+
+    def test_generate_placeholder_without_cases(self, sample_rule):
+        from regulationcoder.codegen.test_generator import TestGenerator
+
+        code = TestGenerator().generate(sample_rule.model_copy(update={"test_cases": []}))
+        assert "def test_eu_ai_act_010_02f_001_placeholder():" in code
+        assert "pytest.skip(" in code
+
+    def test_generate_to_writes_same_source(self, sample_rule, tmp_path):
+        from regulationcoder.codegen.test_generator import TestGenerator
+
+        generator = TestGenerator()
+        path = tmp_path / "generated" / "test_rule.py"
+        generator.generate_to(sample_rule, str(path))
+        assert path.read_text(encoding="utf-8") == generator.generate(sample_rule)
+
+    def test_sanitize_test_name_matches_non_alnum_rule(self):
+        from regulationcoder.codegen.test_generator import TestGenerator
+
+        sanitize = TestGenerator._sanitize_test_name
+        assert sanitize("TC-EU-AI-ACT-010-02F-001-001", "") == "test_tc_eu_ai_act_010_02f_001_001"
+        assert sanitize("test_a.b", "") == "test_a_b"
+        assert sanitize("tc-é-Ω-1", "") == "test_tc_____1"
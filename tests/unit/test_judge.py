@@ -0,0 +1,92 @@
+"""Unit tests for the Anthropic judge gates."""
+
+import asyncio
+import json
+
+import pytest
+
+from regulationcoder.core.judge import GateD
+from regulationcoder.models.judge_report import Verdict
+
+_RESPONSE = {
+    "verdict": "approve",
+    "scores": {"grounding_score": 0.9, "overall_confidence": 0.8},
+    "findings": [],
+    "citations_checked": [],
+}
+
+
+class TestJudgeGate:
+    def test_responses_cached_on_disk(self, tmp_path, fake_anthropic):
+        text = f"```json\n{json.dumps(_RESPONSE)}\n```"
+        gate, messages = fake_anthropic(GateD, str(tmp_path), text)
+        report = gate.evaluate("v1", "v2", "[]", "{}")
+        assert report.verdict == Verdict.APPROVE
+        assert messages.calls == 1
+
+        gate, messages = fake_anthropic(GateD, str(tmp_path), text)
+        assert gate.evaluate("v1", "v2", "[]", "{}").verdict == Verdict.APPROVE
+        assert messages.calls == 0
+
+        gate.evaluate("v1", "v3", "[]", "{}")
+        assert messages.calls == 1
+
+    def test_unparseable_response_not_cached(self, tmp_path, fake_anthropic):
+        gate, messages = fake_anthropic(GateD, str(tmp_path), "not json")
+        for _ in range(2):
+            with pytest.raises(json.JSONDecodeError):
+                gate.evaluate("v1", "v2", "[]", "{}")
+        assert messages.calls == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_evaluate_many_bounds_concurrency(
+        self, tmp_path, fake_anthropic, fake_async_anthropic
+    ):
+        messages = fake_async_anthropic(json.dumps(_RESPONSE))
+        gate, _ = fake_anthropic(GateD, str(tmp_path))
+        items = [
+            {"old_version": "v1", "new_version": f"v{i}", "changes_json": "[]", "impact_json": "{}"}
+            for i in range(2, 7)
+        ]
+
+        reports = gate.evaluate_many(items, concurrency=2)
+        assert [r.target_ids for r in reports] == [[f"v1->v{i}"] for i in range(2, 7)]
+        assert messages.calls == 5
+        assert messages.peak == 2
+
+        gate.evaluate_many(items)
+        assert messages.calls == 5
+
+    def test_evaluate_many_rejects_running_loop(self, tmp_path, fake_anthropic):
+        gate, _ = fake_anthropic(GateD, str(tmp_path))
+
+        async def call_from_loop():
+            gate.evaluate_many([])
+
+        with pytest.raises(RuntimeError, match="evaluate_async"):
+            asyncio.run(call_from_loop())
+
+    def test_parse_judge_text_strips_fences(self):
+        parse = GateD._parse_judge_text
+        assert parse('{"a": 1}') == {"a": 1}
+        assert parse('Result:\n```json\n{"a": 1}\n```\nDone.') == {"a": 1}
+        assert parse('```\n{"a": 1}\n```') == {"a": 1}
+        assert parse('```json\n{"a": 1}\n') == {"a": 1}
+
+    def test_unknown_finding_values_fall_back_to_info(self, tmp_path, fake_anthropic):
+        gate, _ = fake_anthropic(GateD, str(tmp_path))
+        raw = {
+            "verdict": "revise",
+            "findings": [
+                {"finding_type": "omission", "severity": "major", "description": "a"},
+                {"finding_type": "made_up", "severity": "major", "description": "b"},
+                {"finding_type": ["omission"], "severity": "minor"},
+            ],
+        }
+        report = gate._build_report("gate_d_diff", ["v1->v2"], raw)
+        assert [(f.finding_type.value, f.severity.value) for f in report.findings] == [
+            ("omission", "major"),
+            ("ambiguity", "info"),
+            ("ambiguity", "info"),
+        ]
+        assert report.findings[1].description == "b"